@@ -4,6 +4,12 @@ import { useDataStore } from '@/stores/dataStore'
 import { Target, Filter, Calendar, Clock, ChevronDown, X, User, HelpCircle, LogOut } from 'lucide-react'
 import toast from 'react-hot-toast'
 
+const formatHour = (h: number) =>
+  h === 0 ? '12 AM' : h < 12 ? `${h} AM` : h === 12 ? '12 PM' : `${h - 12} PM`
+
+// Hour-of-day option labels shared by both time-range selects
+const HOUR_OPTION_LABELS = Array.from({ length: 24 }, (_, h) => formatHour(h))
+
 interface DashboardToolbarProps {
   onStartTour?: () => void
 }
@@ -52,9 +58,6 @@ export default function DashboardToolbar({ onStartTour }: DashboardToolbarProps)
     }
   }
 
-  const formatHour = (h: number) =>
-    h === 0 ? '12 AM' : h < 12 ? `${h} AM` : h === 12 ? '12 PM' : `${h - 12} PM`
-
   // Build filter chips
   const chips: { label: string; onRemove: () => void }[] = []
   if (filters.startDate && filters.endDate) {
@@ -296,8 +299,8 @@ export default function DashboardToolbar({ onStartTour }: DashboardToolbarProps)
                   style={{ backgroundColor: 'var(--bg-primary)', border: '1px solid var(--border-color)', color: 'var(--text-primary)' }}
                 >
                   <option value="">Any</option>
-                  {Array.from({ length: 24 }, (_, i) => (
-                    <option key={i} value={i}>{formatHour(i)}</option>
+                  {HOUR_OPTION_LABELS.map((label, i) => (
+                    <option key={i} value={i}>{label}</option>
                   ))}
                 </select>
                 <select
@@ -307,8 +310,8 @@ export default function DashboardToolbar({ onStartTour }: DashboardToolbarProps)
                   style={{ backgroundColor: 'var(--bg-primary)', border: '1px solid var(--border-color)', color: 'var(--text-primary)' }}
                 >
                   <option value="">Any</option>
-                  {Array.from({ length: 24 }, (_, i) => (
-                    <option key={i} value={i}>{formatHour(i)}</option>
+                  {HOUR_OPTION_LABELS.map((label, i) => (
+                    <option key={i} value={i}>{label}</option>
                   ))}
                 </select>
               </div>
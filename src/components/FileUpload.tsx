@@ -24,6 +24,12 @@ interface UploadError {
   timestamp: string
 }
 
+type ParsedRow = { dictation_datetime: string; exam_description: string; wrvu_estimate: number }
+
+// Parsed rows per selected File, so retrying an upload (e.g. after a database
+// error) doesn't re-read and re-parse the same workbooks
+const parsedFiles = new WeakMap<File, Promise<ParsedRow[]>>()
+
 export default function FileUpload({ compact = false }: FileUploadProps) {
   const { user } = useAuthStore()
   const { addRecords, loading } = useDataStore()
@@ -32,9 +38,18 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
   const [uploading, setUploading] = useState(false)
   const [uploadError, setUploadError] = useState<UploadError | null>(null)
 
-  const processExcelFile = async (file: File): Promise<{ dictation_datetime: string; exam_description: string; wrvu_estimate: number }[]> => {
+  const processExcelFile = async (file: File): Promise<ParsedRow[]> => {
     const buffer = await file.arrayBuffer()
-    const workbook = XLSX.read(buffer, { type: 'array', cellDates: true })
+    // Only the first sheet's raw values are used, so skip parsing the other
+    // sheets and building formatted text, HTML and formula strings per cell
+    const workbook = XLSX.read(buffer, {
+      type: 'array',
+      cellDates: true,
+      sheets: 0,
+      cellText: false,
+      cellHTML: false,
+      cellFormula: false,
+    })
     const sheetName = workbook.SheetNames[0]
     const worksheet = workbook.Sheets[sheetName]
     
@@ -88,39 +103,41 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
       throw new Error(`Missing WRVU column. Found columns: ${headers.filter(h => h).join(', ')}`)
     }
 
-    // Process data rows (everything after header)
-    const dataRows = allData.slice(headerRowIndex + 1)
-    
-    const data = dataRows
-      .filter(row => {
-        if (!row || !Array.isArray(row)) return false
-        return row[dtIdx] && row[examIdx]
-      })
-      .map(row => {
-        let dateValue = row[dtIdx]
-        
-        // Handle different date formats
-        if (dateValue instanceof Date) {
-          // Already a Date object
-          dateValue = dateValue.toISOString()
-        } else if (typeof dateValue === 'number') {
-          // Excel serial date number
-          const excelDate = XLSX.SSF.parse_date_code(dateValue)
-          if (excelDate) {
-            dateValue = `${excelDate.y}-${String(excelDate.m).padStart(2, '0')}-${String(excelDate.d).padStart(2, '0')} ${String(excelDate.H || 0).padStart(2, '0')}:${String(excelDate.M || 0).padStart(2, '0')}:${String(excelDate.S || 0).padStart(2, '0')}`
-          }
-        }
-        
-        const rvuValue = row[rvuIdx]
-        const wrvu = typeof rvuValue === 'number' ? rvuValue : parseFloat(String(rvuValue)) || 0
-        
-        return {
-          dictation_datetime: String(dateValue),
-          exam_description: String(row[examIdx] || ''),
-          wrvu_estimate: wrvu,
+    // Process data rows (everything after header) in one pass, appending valid
+    // rows straight to the output instead of slicing, filtering and mapping
+    // through intermediate arrays
+    const data: ParsedRow[] = []
+    for (let i = headerRowIndex + 1; i < allData.length; i++) {
+      const row = allData[i]
+      if (!row || !Array.isArray(row)) continue
+      if (!row[dtIdx] || !row[examIdx]) continue
+
+      let dateValue = row[dtIdx]
+      
+      // Handle different date formats
+      if (dateValue instanceof Date) {
+        // Already a Date object
+        dateValue = dateValue.toISOString()
+      } else if (typeof dateValue === 'number') {
+        // Excel serial date number
+        const excelDate = XLSX.SSF.parse_date_code(dateValue)
+        if (excelDate) {
+          dateValue = `${excelDate.y}-${String(excelDate.m).padStart(2, '0')}-${String(excelDate.d).padStart(2, '0')} ${String(excelDate.H || 0).padStart(2, '0')}:${String(excelDate.M || 0).padStart(2, '0')}:${String(excelDate.S || 0).padStart(2, '0')}`
         }
-      })
-      .filter(row => row.dictation_datetime && row.exam_description && !isNaN(row.wrvu_estimate))
+      }
+      
+      const rvuValue = row[rvuIdx]
+      const wrvu = typeof rvuValue === 'number' ? rvuValue : parseFloat(String(rvuValue)) || 0
+      
+      const parsed = {
+        dictation_datetime: String(dateValue),
+        exam_description: String(row[examIdx] || ''),
+        wrvu_estimate: wrvu,
+      }
+      if (parsed.dictation_datetime && parsed.exam_description && !isNaN(parsed.wrvu_estimate)) {
+        data.push(parsed)
+      }
+    }
 
     if (data.length === 0) {
       throw new Error('No valid data rows found after header')
@@ -129,6 +146,17 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
     return data
   }
 
+  const parseFile = (file: File): Promise<ParsedRow[]> => {
+    let parsed = parsedFiles.get(file)
+    if (!parsed) {
+      parsed = processExcelFile(file)
+      // Don't hold on to failures; a retry should parse again
+      parsed.catch(() => parsedFiles.delete(file))
+      parsedFiles.set(file, parsed)
+    }
+    return parsed
+  }
+
   // Upload original file to Supabase Storage
   const uploadFileToStorage = async (file: File, userId: string): Promise<string | null> => {
     const timestamp = Date.now()
@@ -173,7 +201,6 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
 
     setUploading(true)
     setUploadError(null) // Clear previous errors
-    const allData: { dictation_datetime: string; exam_description: string; wrvu_estimate: number }[] = []
     const fileStatuses: ProcessedFile[] = selectedFiles.map(f => ({
       name: f.name,
       rows: 0,
@@ -181,20 +208,17 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
     }))
     setProcessedFiles(fileStatuses)
 
-    const fileErrors: string[] = []
-
-    // Process each file
-    for (let i = 0; i < selectedFiles.length; i++) {
-      const file = selectedFiles[i]
-      
+    // Process the files concurrently, so one file's storage upload and
+    // history write overlap the next file's read and parse. Each file's rows
+    // (or error) is kept at its own index and joined in selection order.
+    const fileResults = await Promise.all(selectedFiles.map(async (file, i) => {
       // Update status to processing
       setProcessedFiles(prev => prev.map((f, idx) => 
         idx === i ? { ...f, status: 'processing' } : f
       ))
 
       try {
-        const data = await processExcelFile(file)
-        allData.push(...data)
+        const data = await parseFile(file)
 
         // Upload original file to storage
         const filePath = await uploadFileToStorage(file, user.id)
@@ -206,9 +230,9 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
         setProcessedFiles(prev => prev.map((f, idx) => 
           idx === i ? { ...f, status: 'done', rows: data.length } : f
         ))
+        return { rows: data }
       } catch (error) {
         const errorMsg = error instanceof Error ? error.message : 'Unknown error'
-        fileErrors.push(`${file.name}: ${errorMsg}`)
         // Update status to error
         setProcessedFiles(prev => prev.map((f, idx) => 
           idx === i ? { 
@@ -217,15 +241,20 @@ export default function FileUpload({ compact = false }: FileUploadProps) {
             error: errorMsg 
           } : f
         ))
+        return { rows: [] as ParsedRow[], error: `${file.name}: ${errorMsg}` }
       }
-    }
+    }))
+    const fileRows: ParsedRow[][] = fileResults.map(r => r.rows)
+    const fileErrors = fileResults.flatMap(r => r.error ? [r.error] : [])
 
     // Upload combined data to Supabase
+    const allData = ([] as ParsedRow[]).concat(...fileRows)
     if (allData.length > 0) {
-      // Sort by date like the old Python version
-      allData.sort((a, b) => 
-        new Date(a.dictation_datetime).getTime() - new Date(b.dictation_datetime).getTime()
-      )
+      // Sort by date like the old Python version. Each timestamp is parsed
+      // once up front instead of twice per comparison.
+      const keyed = allData.map(row => ({ row, time: new Date(row.dictation_datetime).getTime() }))
+      keyed.sort((a, b) => a.time - b.time)
+      keyed.forEach(({ row }, i) => { allData[i] = row })
 
       const result = await addRecords(user.id, allData)
       if (result.error) {
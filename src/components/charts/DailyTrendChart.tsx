@@ -1,3 +1,4 @@
+import { useMemo } from 'react'
 import { useDataStore } from '@/stores/dataStore'
 import { 
   Line, XAxis, YAxis, CartesianGrid, 
@@ -7,15 +8,53 @@ import { TrendingUp, Calendar } from 'lucide-react'
 import InfoTooltip from '../InfoTooltip'
 import { format } from 'date-fns'
 
+// Static chart props, shared across renders so recharts sees the same
+// objects each time instead of fresh literals
+const CHART_MARGIN = { top: 10, right: 10, left: 0, bottom: 0 }
+const AXIS_TICK = { fill: 'var(--text-muted)', fontSize: 10 }
+const AXIS_LINE = { stroke: 'var(--border-color)' }
+const TOOLTIP_CONTENT_STYLE = {
+  backgroundColor: 'var(--bg-card)',
+  border: '1px solid var(--border-color)',
+  borderRadius: '8px',
+  boxShadow: '0 4px 12px rgba(0,0,0,0.15)',
+}
+const TOOLTIP_LABEL_STYLE = { color: 'var(--text-primary)', fontWeight: 600, marginBottom: '4px' }
+const TOOLTIP_ITEM_STYLE = { color: 'var(--text-secondary)', fontSize: '12px' }
+const ACTIVE_DOT = { r: 4, fill: '#22c55e', stroke: 'var(--bg-card)', strokeWidth: 2 }
+
+const formatTooltip = (value: number, name: string) => [
+  value.toFixed(1),
+  name === 'rvu' ? 'Daily RVUs' : '7-Day Average'
+]
+
 export default function DailyTrendChart() {
-  const { dailyData, goalRvuPerDay, metrics } = useDataStore()
+  // Subscribe to just the slices this chart renders, so filter or upload
+  // state changes elsewhere in the store don't re-render it
+  const dailyData = useDataStore(state => state.dailyData)
+  const goalRvuPerDay = useDataStore(state => state.goalRvuPerDay)
+  const metrics = useDataStore(state => state.metrics)
+
+  // Rebuild the chart rows only when the daily series changes, not on every
+  // store update or re-render. Rows carry just the fields the chart reads.
+  const chartData = useMemo(() => dailyData.map(d => ({
+    dateFormatted: format(new Date(d.date), 'MMM d'),
+    rvu: d.rvu,
+    ma7: d.ma7,
+  })), [dailyData])
+
+  // Best-day callout label, formatted once per best day rather than per render
+  const bestDayDate = metrics?.bestDayDate
+  const bestDayLabel = useMemo(
+    () => bestDayDate ? format(new Date(bestDayDate), 'MMM d, yyyy') : '',
+    [bestDayDate]
+  )
 
   if (dailyData.length === 0) return null
 
-  const chartData = dailyData.map(d => ({
-    ...d,
-    dateFormatted: format(new Date(d.date), 'MMM d'),
-  }))
+  // With a single day the 7-day average is that day's value, so skip drawing
+  // a second, identical series
+  const showMovingAverage = dailyData.length > 1
 
   return (
     <section 
@@ -49,10 +88,12 @@ export default function DailyTrendChart() {
             <div className="w-2.5 h-2.5 rounded-full" style={{ backgroundColor: 'var(--accent-primary)' }} />
             <span style={{ color: 'var(--text-muted)' }}>Daily</span>
           </div>
-          <div className="flex items-center gap-1.5">
-            <div className="w-2.5 h-0.5" style={{ backgroundColor: '#f59e0b' }} />
-            <span style={{ color: 'var(--text-muted)' }}>7-Day MA</span>
-          </div>
+          {showMovingAverage && (
+            <div className="flex items-center gap-1.5">
+              <div className="w-2.5 h-0.5" style={{ backgroundColor: '#f59e0b' }} />
+              <span style={{ color: 'var(--text-muted)' }}>7-Day MA</span>
+            </div>
+          )}
           <div className="flex items-center gap-1.5">
             <div className="w-2.5 h-0.5" style={{ backgroundColor: '#ef4444', opacity: 0.7 }} />
             <span style={{ color: 'var(--text-muted)' }}>Target</span>
@@ -62,7 +103,7 @@ export default function DailyTrendChart() {
 
       <div className="h-72">
         <ResponsiveContainer width="100%" height="100%">
-          <ComposedChart data={chartData} margin={{ top: 10, right: 10, left: 0, bottom: 0 }}>
+          <ComposedChart data={chartData} margin={CHART_MARGIN}>
             <defs>
               <linearGradient id="rvuGradient" x1="0" y1="0" x2="0" y2="1">
                 <stop offset="5%" stopColor="#22c55e" stopOpacity={0.2}/>
@@ -72,30 +113,22 @@ export default function DailyTrendChart() {
             <CartesianGrid strokeDasharray="3 3" stroke="var(--border-color)" opacity={0.5} />
             <XAxis 
               dataKey="dateFormatted" 
-              tick={{ fill: 'var(--text-muted)', fontSize: 10 }}
+              tick={AXIS_TICK}
               tickLine={false}
-              axisLine={{ stroke: 'var(--border-color)' }}
+              axisLine={AXIS_LINE}
             />
             <YAxis 
-              tick={{ fill: 'var(--text-muted)', fontSize: 10 }}
+              tick={AXIS_TICK}
               tickLine={false}
-              axisLine={{ stroke: 'var(--border-color)' }}
+              axisLine={AXIS_LINE}
               domain={[0, 'auto']}
               width={35}
             />
             <Tooltip 
-              contentStyle={{
-                backgroundColor: 'var(--bg-card)',
-                border: '1px solid var(--border-color)',
-                borderRadius: '8px',
-                boxShadow: '0 4px 12px rgba(0,0,0,0.15)',
-              }}
-              labelStyle={{ color: 'var(--text-primary)', fontWeight: 600, marginBottom: '4px' }}
-              itemStyle={{ color: 'var(--text-secondary)', fontSize: '12px' }}
-              formatter={(value: number, name: string) => [
-                value.toFixed(1),
-                name === 'rvu' ? 'Daily RVUs' : '7-Day Average'
-              ]}
+              contentStyle={TOOLTIP_CONTENT_STYLE}
+              labelStyle={TOOLTIP_LABEL_STYLE}
+              itemStyle={TOOLTIP_ITEM_STYLE}
+              formatter={formatTooltip}
             />
             <ReferenceLine 
               y={goalRvuPerDay} 
@@ -116,16 +149,18 @@ export default function DailyTrendChart() {
               stroke="#22c55e" 
               strokeWidth={2}
               dot={false}
-              activeDot={{ r: 4, fill: '#22c55e', stroke: 'var(--bg-card)', strokeWidth: 2 }}
-            />
-            <Line 
-              type="monotone" 
-              dataKey="ma7" 
-              stroke="#f59e0b" 
-              strokeWidth={1.5}
-              strokeDasharray="4 4"
-              dot={false}
+              activeDot={ACTIVE_DOT}
             />
+            {showMovingAverage && (
+              <Line 
+                type="monotone" 
+                dataKey="ma7" 
+                stroke="#f59e0b" 
+                strokeWidth={1.5}
+                strokeDasharray="4 4"
+                dot={false}
+              />
+            )}
           </ComposedChart>
         </ResponsiveContainer>
       </div>
@@ -136,7 +171,7 @@ export default function DailyTrendChart() {
           <Calendar className="w-3.5 h-3.5" style={{ color: 'var(--warning)' }} />
           <span style={{ color: 'var(--text-muted)' }}>Best Day:</span>
           <span style={{ color: 'var(--text-primary)' }}>
-            {format(new Date(metrics.bestDayDate), 'MMM d, yyyy')}
+            {bestDayLabel}
           </span>
           <span style={{ color: 'var(--accent-primary)' }}>
             {metrics.bestDayRvu.toFixed(1)} RVUs
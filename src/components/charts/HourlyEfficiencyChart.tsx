@@ -1,3 +1,4 @@
+import { useMemo } from 'react'
 import { useDataStore } from '@/stores/dataStore'
 import { 
   BarChart, Bar, XAxis, YAxis, CartesianGrid, 
@@ -6,20 +7,46 @@ import {
 import { Clock } from 'lucide-react'
 import InfoTooltip from '../InfoTooltip'
 
-export default function HourlyEfficiencyChart() {
-  const { hourlyData, goalRvuPerDay } = useDataStore()
+// Static chart props, shared across renders so recharts sees the same
+// objects each time instead of fresh literals
+const CHART_MARGIN = { top: 10, right: 10, left: 0, bottom: 0 }
+const X_AXIS_TICK = { fill: 'var(--text-muted)', fontSize: 10 }
+const Y_AXIS_TICK = { fill: 'var(--text-muted)', fontSize: 11 }
+const AXIS_LINE = { stroke: 'var(--border-color)' }
+const BAR_RADIUS: [number, number, number, number] = [4, 4, 0, 0]
+const TOOLTIP_CONTENT_STYLE = {
+  backgroundColor: 'var(--bg-card)',
+  border: '1px solid var(--border-color)',
+  borderRadius: '8px',
+  boxShadow: 'var(--shadow-lg)',
+}
+const TOOLTIP_LABEL_STYLE = { color: 'var(--text-primary)', fontWeight: 600 }
+const TOOLTIP_ITEM_STYLE = { color: 'var(--text-secondary)', fontSize: '12px' }
 
-  if (hourlyData.length === 0) return null
+// Axis label for each hour of the day, e.g. "6a", "12p"
+const HOUR_LABELS = Array.from({ length: 24 }, (_, hour) => `${hour % 12 || 12}${hour < 12 ? 'a' : 'p'}`)
 
-  const hourlyTarget = goalRvuPerDay / 8
+const formatTooltip = (value: number) => [value.toFixed(2), 'Avg RVUs/hour']
+const formatTooltipLabel = (label: unknown) => `${label}`
+
+export default function HourlyEfficiencyChart() {
+  // Subscribe to just the slices this chart renders
+  const hourlyData = useDataStore(state => state.hourlyData)
+  const goalRvuPerDay = useDataStore(state => state.goalRvuPerDay)
 
-  // Filter to reasonable hours (6 AM - 10 PM)
-  const filteredData = hourlyData
+  // Filter to reasonable hours (6 AM - 10 PM); rebuilt only when the hourly
+  // series changes, keeping just the fields the bars read
+  const filteredData = useMemo(() => hourlyData
     .filter(d => d.hour >= 6 && d.hour <= 22)
     .map(d => ({
-      ...d,
-      hourLabel: `${d.hour % 12 || 12}${d.hour < 12 ? 'a' : 'p'}`,
-    }))
+      hourLabel: HOUR_LABELS[d.hour],
+      rvu: d.rvu,
+      meetsTarget: d.meetsTarget,
+    })), [hourlyData])
+
+  if (hourlyData.length === 0) return null
+
+  const hourlyTarget = goalRvuPerDay / 8
 
   return (
     <section 
@@ -50,30 +77,25 @@ export default function HourlyEfficiencyChart() {
 
       <div className="h-64">
         <ResponsiveContainer width="100%" height="100%">
-          <BarChart data={filteredData} margin={{ top: 10, right: 10, left: 0, bottom: 0 }}>
+          <BarChart data={filteredData} margin={CHART_MARGIN}>
             <CartesianGrid strokeDasharray="3 3" stroke="var(--border-color)" opacity={0.5} vertical={false} />
             <XAxis 
               dataKey="hourLabel" 
-              tick={{ fill: 'var(--text-muted)', fontSize: 10 }}
+              tick={X_AXIS_TICK}
               tickLine={false}
-              axisLine={{ stroke: 'var(--border-color)' }}
+              axisLine={AXIS_LINE}
             />
             <YAxis 
-              tick={{ fill: 'var(--text-muted)', fontSize: 11 }}
+              tick={Y_AXIS_TICK}
               tickLine={false}
-              axisLine={{ stroke: 'var(--border-color)' }}
+              axisLine={AXIS_LINE}
             />
             <Tooltip 
-              contentStyle={{
-                backgroundColor: 'var(--bg-card)',
-                border: '1px solid var(--border-color)',
-                borderRadius: '8px',
-                boxShadow: 'var(--shadow-lg)',
-              }}
-              labelStyle={{ color: 'var(--text-primary)', fontWeight: 600 }}
-              itemStyle={{ color: 'var(--text-secondary)', fontSize: '12px' }}
-              formatter={(value: number) => [value.toFixed(2), 'Avg RVUs/hour']}
-              labelFormatter={(label) => `${label}`}
+              contentStyle={TOOLTIP_CONTENT_STYLE}
+              labelStyle={TOOLTIP_LABEL_STYLE}
+              itemStyle={TOOLTIP_ITEM_STYLE}
+              formatter={formatTooltip}
+              labelFormatter={formatTooltipLabel}
             />
             <ReferenceLine 
               y={hourlyTarget} 
@@ -83,7 +105,7 @@ export default function HourlyEfficiencyChart() {
             />
             <Bar 
               dataKey="rvu" 
-              radius={[4, 4, 0, 0]}
+              radius={BAR_RADIUS}
               maxBarSize={24}
             >
               {filteredData.map((entry, index) => (
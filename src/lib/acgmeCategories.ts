@@ -155,13 +155,19 @@ export interface AcgmeCount {
 /** Counts records into each ACGME category. A record may count in several categories. */
 export function countAcgmeCategories(records: RVURecord[]): AcgmeCount[] {
   const results: AcgmeCount[] = ACGME_CATEGORIES.map(category => ({ category, count: 0, matched: [] }))
+  // Matching depends only on the description, so classify and match each
+  // distinct description once and reuse its category list for repeats
+  const matchesByDesc = new Map<string, AcgmeCount[]>()
   for (const rec of records) {
-    const attrs = classifyStudy(rec.examDescription)
-    for (const result of results) {
-      if (result.category.match(attrs)) {
-        result.count++
-        result.matched.push(rec)
-      }
+    let matches = matchesByDesc.get(rec.examDescription)
+    if (!matches) {
+      const attrs = classifyStudy(rec.examDescription)
+      matches = results.filter(result => result.category.match(attrs))
+      matchesByDesc.set(rec.examDescription, matches)
+    }
+    for (const result of matches) {
+      result.count++
+      result.matched.push(rec)
     }
   }
   return results
@@ -23,7 +23,15 @@ function toNum(v: unknown): number | null {
 }
 
 export function parseAcgmeReport(data: ArrayBuffer): ParsedReportRow[] {
-  const wb = XLSX.read(data, { type: 'array' })
+  // Only the first sheet's raw values are read, so skip the other sheets and
+  // the formatted text, HTML and formula strings SheetJS builds per cell
+  const wb = XLSX.read(data, {
+    type: 'array',
+    sheets: 0,
+    cellText: false,
+    cellHTML: false,
+    cellFormula: false,
+  })
   const ws = wb.Sheets[wb.SheetNames[0]]
   if (!ws) return []
   const rows = XLSX.utils.sheet_to_json<(string | number)[]>(ws, { header: 1, defval: '' })
@@ -26,6 +26,14 @@ export interface ClassificationRule {
   description?: string
 }
 
+// Patterns shared by several function rules, compiled once at module load
+// rather than re-created from a literal on every rule evaluation
+const PET = /PET/i
+const FL_PREFIX = /FL\s/i
+// Word-boundary tokens so "humerUS" / "reCTAl" don't read as US / CT modality.
+const OTHER_MODALITY_TOKEN = /\b(CT|CTA|MR|MRI|MRA|MRV|US|ULTRASOUND|FLUORO|FL|PET|SPECT|NM|DOPPLER)\b/i
+const SKULL_BASE_TO_THIGH = /(SKULL\s+BASE.*THIGH|SKULL\s+BASE\s*-\s*MID\s+THIGH)/i
+
 /**
  * MODALITY CLASSIFICATION RULES
  * Applied in priority order (lower priority number = checked first)
@@ -120,7 +128,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
   {
     priority: 21,
     pattern: (text: string) => {
-      return /PET/i.test(text) && /(CONCURRENT\s+CT|W\/\s+CT|WITH\s+CT)/i.test(text)
+      return PET.test(text) && /(CONCURRENT\s+CT|W\/\s+CT|WITH\s+CT)/i.test(text)
     },
     result: 'PET/CT',
     description: 'PET with concurrent CT'
@@ -128,7 +136,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
   {
     priority: 22,
     pattern: (text: string) => {
-      return /PET/i.test(text) && /TUMOR\s+IMAGING/i.test(text)
+      return PET.test(text) && /TUMOR\s+IMAGING/i.test(text)
     },
     result: 'PET/CT',
     description: 'PET tumor imaging'
@@ -175,7 +183,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
   {
     priority: 40,
     pattern: (text: string) => {
-      return /FL\s/i.test(text) && /LUMBAR\s+PUNCTURE/i.test(text)
+      return FL_PREFIX.test(text) && /LUMBAR\s+PUNCTURE/i.test(text)
     },
     result: 'Fluoroscopy',
     description: 'FL Lumbar Puncture (not CT)'
@@ -183,7 +191,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
   {
     priority: 41,
     pattern: (text: string) => {
-      return /FL\s/i.test(text) && /(ESOPHAG|SWALLOW)/i.test(text)
+      return FL_PREFIX.test(text) && /(ESOPHAG|SWALLOW)/i.test(text)
     },
     result: 'Fluoroscopy',
     description: 'FL Esophagus/Esophagram (not US)'
@@ -191,7 +199,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
   {
     priority: 42,
     pattern: (text: string) => {
-      return /FL\s/i.test(text) && /(ACCESS|PORTACATH)/i.test(text)
+      return FL_PREFIX.test(text) && /(ACCESS|PORTACATH)/i.test(text)
     },
     result: 'Fluoroscopy',
     description: 'FL Access Portacath (not CT)'
@@ -302,8 +310,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
     pattern: (text: string) => {
       const hasViews = /\d+\s*VIEWS?/i.test(text) || /(AP|PA).*(LAT|LATERAL)/i.test(text)
       const hasBodyPart = /(CHEST|ABDOMEN|KNEE|HAND|FOOT|SHOULDER|ELBOW|ANKLE|WRIST|HIP|FEMUR|TIBIA|HUMERUS|FINGER|TOE|SPINE|PELVIS|CLAVICLE|RIBS|SINUS|TEMPORAL|FACIAL|ORBITS|SKULL|SACRUM|COCCYX|LUMBOSACRAL|KNEES)/i.test(text)
-      // Word-boundary tokens so "humerUS" / "reCTAl" don't read as US / CT modality.
-      const noOtherModality = !/\b(CT|CTA|MR|MRI|MRA|MRV|US|ULTRASOUND|FLUORO|FL|PET|SPECT|NM|DOPPLER)\b/i.test(text)
+      const noOtherModality = !OTHER_MODALITY_TOKEN.test(text)
       return hasViews && hasBodyPart && noOtherModality
     },
     result: 'Radiography',
@@ -314,7 +321,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
     pattern: (text: string) => {
       const hasBilateral = /BILATERAL/i.test(text)
       const hasExtremity = /(KNEE|KNEES|HIP|HIPS)/i.test(text)
-      const noOtherModality = !/\b(CT|CTA|MR|MRI|MRA|MRV|US|ULTRASOUND|FLUORO|FL|PET|SPECT|NM|DOPPLER)\b/i.test(text)
+      const noOtherModality = !OTHER_MODALITY_TOKEN.test(text)
       return hasBilateral && hasExtremity && noOtherModality
     },
     result: 'Radiography',
@@ -325,7 +332,7 @@ export const MODALITY_RULES: ClassificationRule[] = [
     pattern: (text: string) => {
       const hasStanding = /STANDING/i.test(text)
       const hasExtremity = /(KNEE|HIP|SPINE)/i.test(text)
-      const noOtherModality = !/\b(CT|CTA|MR|MRI|MRA|MRV|US|ULTRASOUND|FLUORO|FL|PET|SPECT|NM|DOPPLER)\b/i.test(text)
+      const noOtherModality = !OTHER_MODALITY_TOKEN.test(text)
       return hasStanding && hasExtremity && noOtherModality
     },
     result: 'Radiography',
@@ -566,7 +573,7 @@ export const BODY_PART_RULES: ClassificationRule[] = [
     priority: 36,
     pattern: (text: string) => {
       // PET tumor imaging with SKULL BASE - MID THIGH should be Whole Body
-      return /PET/i.test(text) && /TUMOR\s+IMAGING/i.test(text) && /(SKULL\s+BASE.*THIGH|SKULL\s+BASE\s*-\s*MID\s+THIGH)/i.test(text)
+      return PET.test(text) && /TUMOR\s+IMAGING/i.test(text) && SKULL_BASE_TO_THIGH.test(text)
     },
     result: 'Whole Body',
     description: 'PET tumor imaging SKULL BASE - MID THIGH → Whole Body'
@@ -583,7 +590,7 @@ export const BODY_PART_RULES: ClassificationRule[] = [
     priority: 41,
     pattern: (text: string) => {
       // Brain PET → Head/Neck (but exclude SKULL BASE - MID THIGH which is whole body)
-      return /PET/i.test(text) && /(BRAIN|DEMENTIA|AMYLOID)/i.test(text) && !/(SKULL\s+BASE.*THIGH|SKULL\s+BASE\s*-\s*MID\s+THIGH)/i.test(text)
+      return PET.test(text) && /(BRAIN|DEMENTIA|AMYLOID)/i.test(text) && !SKULL_BASE_TO_THIGH.test(text)
     },
     result: 'Head/Neck',
     description: 'Brain PET → Head/Neck (exclude whole body scans)'
@@ -591,7 +598,7 @@ export const BODY_PART_RULES: ClassificationRule[] = [
   {
     priority: 42,
     pattern: (text: string) => {
-      return /PET/i.test(text) && /(LOWER\s+EXTREMITY|LEG|THIGH)/i.test(text)
+      return PET.test(text) && /(LOWER\s+EXTREMITY|LEG|THIGH)/i.test(text)
     },
     result: 'Lower Extremity',
     description: 'PET/CT for lower extremity'
@@ -605,15 +612,9 @@ export const BODY_PART_RULES: ClassificationRule[] = [
   {
     priority: 44,
     pattern: (text: string) => {
-      if (/CT/i.test(text)) {
-        if (/(CHEST|ABDOMEN|PELVIS)/i.test(text)) {
-          return true // Will be handled by regionCT function in dataProcessing
-        }
-        if (/(HEAD|BRAIN|NECK|SPINE|LUMBAR|CERVICAL|THORACIC)/i.test(text)) {
-          return true
-        }
-      }
-      return false
+      // Any CT region keyword, in one scan; which one is decided by the
+      // regionCT function in dataProcessing
+      return /CT/i.test(text) && /(CHEST|ABDOMEN|PELVIS|HEAD|BRAIN|NECK|SPINE|LUMBAR|CERVICAL|THORACIC)/i.test(text)
     },
     result: 'CT Region',
     description: 'CT body region detection (processed separately)'
@@ -684,6 +685,93 @@ export const POST_PROCESSING_RULES: Array<{
   }
 ]
 
+interface CompiledRule {
+  test: (text: string) => boolean
+  mustInclude?: RegExp[]
+  mustNotInclude?: RegExp[]
+  result: string
+}
+
+// A run of consecutive plain-regex rules is tested with one combined regex.
+// Each rule becomes an alternative `(?=[\s\S]*?(?:pattern))()` anchored at the
+// start of the text, so the first alternative that succeeds is the first rule
+// in priority order that matches anywhere; its empty marker group says which.
+interface RuleGroup {
+  scan: RegExp
+  markers: number[]
+  results: string[]
+}
+
+type CompiledStep = CompiledRule | RuleGroup
+
+// Rule tables are static, so sort and compile each one on first use
+const compiledRuleCache = new WeakMap<ClassificationRule[], CompiledStep[]>()
+
+// Only case-insensitive patterns without other flags can share a combined regex
+const isGroupable = (rule: ClassificationRule): rule is ClassificationRule & { pattern: RegExp } =>
+  rule.pattern instanceof RegExp && rule.pattern.flags === 'i' && !rule.conditions
+
+function countGroups(source: string): number {
+  return new RegExp(`(?:${source})|`).exec('')!.length - 1
+}
+
+function compileGroup(rules: (ClassificationRule & { pattern: RegExp })[]): RuleGroup {
+  const markers: number[] = []
+  let group = 0
+  const alternatives = rules.map(({ pattern }) => {
+    group += countGroups(pattern.source) + 1
+    markers.push(group)
+    return `(?=[\\s\\S]*?(?:${pattern.source}))()`
+  })
+  return {
+    scan: new RegExp(`^(?:${alternatives.join('|')})`, 'i'),
+    markers,
+    results: rules.map(rule => rule.result),
+  }
+}
+
+function compileRule(rule: ClassificationRule): CompiledRule {
+  const toRegExp = (term: string) => new RegExp(term, 'i')
+  const { pattern, conditions } = rule
+  let test: (text: string) => boolean
+  if (typeof pattern === 'string') {
+    const re = toRegExp(pattern)
+    test = text => re.test(text)
+  } else if (pattern instanceof RegExp) {
+    test = text => pattern.test(text)
+  } else {
+    test = pattern
+  }
+  return {
+    test,
+    mustInclude: conditions?.mustInclude?.map(toRegExp),
+    mustNotInclude: conditions?.mustNotInclude?.map(toRegExp),
+    result: rule.result
+  }
+}
+
+function compileRules(rules: ClassificationRule[]): CompiledStep[] {
+  const cached = compiledRuleCache.get(rules)
+  if (cached) return cached
+  
+  const sorted = [...rules].sort((a, b) => a.priority - b.priority)
+  const compiled: CompiledStep[] = []
+  for (let i = 0; i < sorted.length;) {
+    let j = i
+    while (j < sorted.length && isGroupable(sorted[j])) j++
+    if (j - i > 1) {
+      compiled.push(compileGroup(sorted.slice(i, j) as (ClassificationRule & { pattern: RegExp })[]))
+      i = j
+    } else {
+      compiled.push(compileRule(sorted[i]))
+      i++
+    }
+  }
+  
+  compiledRuleCache.set(rules, compiled)
+  return compiled
+}
+
 /**
  * Apply classification rules to text
  */
@@ -691,42 +779,33 @@ export function applyClassificationRules(
   text: string,
   rules: ClassificationRule[]
 ): string {
-  const upperText = text.toUpperCase()
-  
-  for (const rule of rules.sort((a, b) => a.priority - b.priority)) {
-    let matches = false
-    
-    // Check pattern
-    if (typeof rule.pattern === 'string') {
-      matches = new RegExp(rule.pattern, 'i').test(upperText)
-    } else if (rule.pattern instanceof RegExp) {
-      matches = rule.pattern.test(upperText)
-    } else if (typeof rule.pattern === 'function') {
-      matches = rule.pattern(upperText)
+  return matchClassificationRules(text.toUpperCase(), rules)
+}
+
+/**
+ * Apply classification rules to text that is already upper-cased, for
+ * callers that run several rule tables over the same description
+ */
+export function matchClassificationRules(
+  upperText: string,
+  rules: ClassificationRule[]
+): string {
+  for (const step of compileRules(rules)) {
+    if ('scan' in step) {
+      const m = step.scan.exec(upperText)
+      if (!m) continue
+      const k = step.markers.findIndex(g => m[g] !== undefined)
+      return step.results[k]
     }
     
-    if (!matches) continue
+    if (!step.test(upperText)) continue
     
     // Check conditions
-    if (rule.conditions) {
-      if (rule.conditions.mustInclude) {
-        const allPresent = rule.conditions.mustInclude.every(term =>
-          new RegExp(term, 'i').test(upperText)
-        )
-        if (!allPresent) continue
-      }
-      
-      if (rule.conditions.mustNotInclude) {
-        const anyPresent = rule.conditions.mustNotInclude.some(term =>
-          new RegExp(term, 'i').test(upperText)
-        )
-        if (anyPresent) continue
-      }
-    }
+    if (step.mustInclude && !step.mustInclude.every(re => re.test(upperText))) continue
+    if (step.mustNotInclude && step.mustNotInclude.some(re => re.test(upperText))) continue
     
-    return rule.result
+    return step.result
   }
   
   return 'Unknown'
 }
-
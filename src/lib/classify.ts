@@ -7,10 +7,11 @@
 // derived from these attributes rather than from a second pass over raw text.
 //
 // Modality/body-part detection reuses the proven, tested rules in
-// classificationMaps.ts (via dataProcessing) so this layer adds structure without
+// classificationMaps.ts (body parts via dataProcessing) so this layer adds structure without
 // regressing those outputs. See taxonomy.ts for the controlled vocabularies.
 
-import { modalityFromDesc, bodyPartsFromDesc } from './dataProcessing'
+import { bodyPartsWithModality } from './dataProcessing'
+import { MODALITY_RULES, matchClassificationRules } from './classificationMaps'
 import { coarseRegion, BodyRegion } from './taxonomy'
 
 export type Contrast = 'with' | 'without' | 'with-and-without'
@@ -62,14 +63,25 @@ function detectLaterality(t: string): Laterality | undefined {
   return undefined
 }
 
+// Procedure keywords, in precedence order (first match wins).
+const PROCEDURE_PATTERNS: [Procedure, RegExp][] = [
+  ['biopsy', /BIOPSY|\bBX\b/],
+  ['paracentesis', /PARACENTESIS/],
+  ['thoracentesis', /THORACENTESIS/],
+  ['drainage', /DRAINAGE|\bDRAIN\b/],
+  ['fna', /\bFNA\b/],
+  ['aspiration', /ASPIRAT/],
+  ['localization', /LOCALIZATION/],
+]
+// Most studies aren't procedures, so one scan for any keyword settles them
+// before the ordered checks run.
+const ANY_PROCEDURE = new RegExp(PROCEDURE_PATTERNS.map(([, re]) => re.source).join('|'))
+
 function detectProcedure(t: string): Procedure | undefined {
-  if (/BIOPSY|\bBX\b/.test(t)) return 'biopsy'
-  if (/PARACENTESIS/.test(t)) return 'paracentesis'
-  if (/THORACENTESIS/.test(t)) return 'thoracentesis'
-  if (/DRAINAGE|\bDRAIN\b/.test(t)) return 'drainage'
-  if (/\bFNA\b/.test(t)) return 'fna'
-  if (/ASPIRAT/.test(t)) return 'aspiration'
-  if (/LOCALIZATION/.test(t)) return 'localization'
+  if (!ANY_PROCEDURE.test(t)) return undefined
+  for (const [procedure, re] of PROCEDURE_PATTERNS) {
+    if (re.test(t)) return procedure
+  }
   return undefined
 }
 
@@ -81,16 +93,34 @@ function detectGuidance(t: string): Guidance | undefined {
   return undefined
 }
 
+// Region keywords, in the order regions are reported.
+const REGION_PATTERNS: [BodyRegion, string][] = [
+  ['Chest', '\\bCHEST\\b|THORAX|\\bLUNG'],
+  ['Abdomen', 'ABDOMEN|\\bABD\\b'],
+  ['Pelvis', 'PELVI|\\bPEL\\b'],
+  ['Head/Neck', 'BRAIN|\\bHEAD\\b|\\bNECK\\b|SKULL|SINUS|ORBIT|FACIAL'],
+  ['Spine', 'SPINE|LUMBAR|CERVICAL|THORACIC|MYELOGRAM|SACR'],
+  ['Breast', 'BREAST|MAMMO'],
+]
+// One sweep over the text instead of a regex per region. Each region is a
+// capture group inside a lookahead, so matches never consume characters and a
+// keyword can't hide another that overlaps it (e.g. SKULL/LUMBAR in "SKULLUMBAR").
+const REGION_SCAN = new RegExp(`(?=${REGION_PATTERNS.map(([, p]) => `(${p})`).join('|')})`, 'g')
+const ALL_REGIONS = (1 << REGION_PATTERNS.length) - 1
+
 // Coarse regions detected directly from the text, so a combined CT chest/abd/pel
 // keeps all three regions even when the fine body-part label collapses them.
 function detectRegions(t: string, focus: string[]): BodyRegion[] {
+  let mask = 0
+  REGION_SCAN.lastIndex = 0
+  for (let m = REGION_SCAN.exec(t); m && mask !== ALL_REGIONS; m = REGION_SCAN.exec(t)) {
+    for (let g = 1; g < m.length; g++) {
+      if (m[g] !== undefined) { mask |= 1 << (g - 1); break }
+    }
+    REGION_SCAN.lastIndex++
+  }
   const regions = new Set<BodyRegion>()
-  if (/\bCHEST\b|THORAX|\bLUNG/.test(t)) regions.add('Chest')
-  if (/ABDOMEN|\bABD\b/.test(t)) regions.add('Abdomen')
-  if (/PELVI|\bPEL\b/.test(t)) regions.add('Pelvis')
-  if (/BRAIN|\bHEAD\b|\bNECK\b|SKULL|SINUS|ORBIT|FACIAL/.test(t)) regions.add('Head/Neck')
-  if (/SPINE|LUMBAR|CERVICAL|THORACIC|MYELOGRAM|SACR/.test(t)) regions.add('Spine')
-  if (/BREAST|MAMMO/.test(t)) regions.add('Breast')
+  REGION_PATTERNS.forEach(([region], i) => { if (mask & (1 << i)) regions.add(region) })
   // Fall back to the coarse region of the fine focus labels.
   if (regions.size === 0) {
     for (const f of focus) {
@@ -104,8 +134,9 @@ function detectRegions(t: string, focus: string[]): BodyRegion[] {
 
 export function classifyStudy(desc: string): StudyAttributes {
   const raw = (desc || '').toUpperCase()
-  const modality = modalityFromDesc(desc)
-  const focus = bodyPartsFromDesc(desc).split(',').map(s => s.trim()).filter(Boolean)
+  // raw is already upper-cased, so run the modality rules on it directly
+  const modality = matchClassificationRules(raw, MODALITY_RULES)
+  const focus = bodyPartsWithModality(raw, modality).split(',').map(s => s.trim()).filter(Boolean)
   const unclassified = modality === 'Unknown' || modality === 'Other' ||
     focus.length === 0 || focus.every(f => f === 'Unknown')
 
@@ -5,7 +5,7 @@ import {
   MODALITY_RULES, 
   BODY_PART_RULES, 
   POST_PROCESSING_RULES,
-  applyClassificationRules 
+  matchClassificationRules
 } from './classificationMaps'
 
 export interface RVURecord {
@@ -62,35 +62,84 @@ export interface CaseMixData {
  * Uses systematic mapping-based classification rules
  */
 export function modalityFromDesc(s: string): string {
-  return applyClassificationRules(s, MODALITY_RULES)
+  return matchClassificationRules(s.toUpperCase(), MODALITY_RULES)
 }
 
+const RE_WITH_AND_WITHOUT = /WITH\s*(AND|&)?\s*WITHOUT|W\/.*AND.*W\/O|W\s*&\s*W\/O/i
+const RE_WITHOUT = /\bWITHOUT\b|\bW\/O\b|\bWO\b/i
+// "w/o" is handled first, so any remaining "W/" means "with contrast".
+// (Trailing \b failed on "W/ CONTRAST" because "/" → space is not a word boundary.)
+const RE_WITH = /\bWITH\b|W\//i
+
 /**
  * Extracts contrast information from exam description
  */
 function contrastPhrase(t: string): string {
-  if (/WITH\s*(AND|&)?\s*WITHOUT|W\/.*AND.*W\/O|W\s*&\s*W\/O/i.test(t)) return 'w/ and w/o Contrast'
-  if (/\bWITHOUT\b|\bW\/O\b|\bWO\b/i.test(t)) return 'w/o Contrast'
-  // "w/o" is handled above, so any remaining "W/" here means "with contrast".
-  // (Trailing \b failed on "W/ CONTRAST" because "/" → space is not a word boundary.)
-  if (/\bWITH\b|W\//i.test(t)) return 'w/ Contrast'
+  if (RE_WITH_AND_WITHOUT.test(t)) return 'w/ and w/o Contrast'
+  if (RE_WITHOUT.test(t)) return 'w/o Contrast'
+  if (RE_WITH.test(t)) return 'w/ Contrast'
   return ''
 }
 
+// CT region keywords, each mapped to a bit in the scan mask
+const CT_CHEST = 1
+const CT_ABDOMEN = 2
+const CT_PELVIS = 4
+const CT_HEAD = 8
+const CT_NECK = 16
+const CT_SPINE = 32
+const CT_KEYWORDS: [string, number][] = [
+  ['CHEST', CT_CHEST],
+  ['ABDOMEN', CT_ABDOMEN],
+  ['PELVIS', CT_PELVIS],
+  ['HEAD', CT_HEAD],
+  ['BRAIN', CT_HEAD],
+  ['NECK', CT_NECK],
+  ['SPINE', CT_SPINE],
+  ['LUMBAR', CT_SPINE],
+  ['CERVICAL', CT_SPINE],
+  ['THORACIC', CT_SPINE],
+]
+// All keywords in one pass; the lookahead keeps matches zero-width so
+// overlapping keywords are still seen, same as independent includes()
+const CT_KEYWORD_SCAN = new RegExp(`(?=${CT_KEYWORDS.map(([w]) => `(${w})`).join('|')})`, 'g')
+
+function ctKeywordMask(t: string): number {
+  let mask = 0
+  CT_KEYWORD_SCAN.lastIndex = 0
+  for (let m = CT_KEYWORD_SCAN.exec(t); m; m = CT_KEYWORD_SCAN.exec(t)) {
+    for (let g = 1; g < m.length; g++) {
+      if (m[g] !== undefined) { mask |= CT_KEYWORDS[g - 1][1]; break }
+    }
+    CT_KEYWORD_SCAN.lastIndex++
+  }
+  return mask
+}
+
+/**
+ * Resolves a CT keyword mask to its body-part label
+ */
+function ctRegionLabel(mask: number): string {
+  const has = (bit: number) => (mask & bit) !== 0
+  if (has(CT_CHEST) && (has(CT_ABDOMEN) || has(CT_PELVIS))) return 'Chest, Abdomen, Pelvis'
+  if (has(CT_ABDOMEN) && has(CT_PELVIS)) return 'Abdomen, Pelvis'
+  if (has(CT_CHEST)) return 'Chest'
+  if (has(CT_ABDOMEN)) return 'Abdomen'
+  if (has(CT_PELVIS)) return 'Pelvis'
+  if (has(CT_HEAD)) return 'Head'
+  if (has(CT_NECK)) return 'Neck'
+  if (has(CT_SPINE)) return 'Spine'
+  return 'Unknown'
+}
+
+// Every keyword combination resolved once, so a lookup replaces the ladder
+const CT_REGION_LABELS = Array.from({ length: CT_SPINE * 2 }, (_, mask) => ctRegionLabel(mask))
+
 /**
  * Determines CT body region from description
  */
 function regionCT(t: string): string {
-  const has = (w: string) => t.includes(w)
-  if (has('CHEST') && (has('ABDOMEN') || has('PELVIS'))) return 'Chest/Abdomen/Pelvis'
-  if (has('ABDOMEN') && has('PELVIS')) return 'Abdomen/Pelvis'
-  if (has('CHEST')) return 'Chest'
-  if (has('ABDOMEN')) return 'Abdomen'
-  if (has('PELVIS')) return 'Pelvis'
-  if (has('HEAD') || has('BRAIN')) return 'Head'
-  if (has('NECK')) return 'Neck'
-  if (has('SPINE') || has('LUMBAR') || has('CERVICAL') || has('THORACIC')) return 'Spine'
-  return 'Other'
+  return CT_REGION_LABELS[ctKeywordMask(t)]
 }
 
 /**
@@ -98,28 +147,29 @@ function regionCT(t: string): string {
  * Uses systematic mapping-based classification rules
  */
 export function bodyPartsFromDesc(s: string): string {
-  let result = applyClassificationRules(s, BODY_PART_RULES)
+  const t = s.toUpperCase()
+  return bodyPartsWithModality(t, matchClassificationRules(t, MODALITY_RULES))
+}
+
+/**
+ * Body-part classification of an upper-cased description given its
+ * already-computed modality, so callers that need both don't run the
+ * modality rules twice or re-upper-case the text
+ */
+export function bodyPartsWithModality(t: string, modality: string): string {
+  let result = matchClassificationRules(t, BODY_PART_RULES)
   
   // Handle special CT region detection
-  const t = s.toUpperCase()
   if (result === 'CT Region' && t.includes('CT')) {
-    const region = regionCT(t)
-    if (region !== 'Other') {
-      if (region === 'Chest/Abdomen/Pelvis') result = 'Chest, Abdomen, Pelvis'
-      else if (region === 'Abdomen/Pelvis') result = 'Abdomen, Pelvis'
-      else result = region
-    } else {
-      result = 'Unknown'
-    }
+    result = regionCT(t)
   }
   
   // Handle multiple body parts (e.g., "Liver, Spleen")
   let bodyParts = result.split(',').map(bp => bp.trim()).filter(Boolean)
   
   // Apply post-processing rules
-  const modality = modalityFromDesc(s)
   for (const rule of POST_PROCESSING_RULES) {
-    if (rule.condition(modality, result, s)) {
+    if (rule.condition(modality, result, t)) {
       const updated = rule.action(modality, result)
       result = updated.bodyPart
       bodyParts = result.split(',').map(bp => bp.trim()).filter(Boolean)
@@ -140,101 +190,143 @@ export function bodyPartsFromDesc(s: string): string {
  * Creates a standardized exam type label from description
  */
 export function examFromDesc(s: string): string {
-  const t = s.toUpperCase().replace(/\s+/g, ' ').trim()
-  const mod = modalityFromDesc(t)
-  
-  let bodyPart = bodyPartsFromDesc(t)
+  return examFromUpper(normalizeUpper(s.toUpperCase()))
+}
+
+function normalizeUpper(t: string): string {
+  return t.replace(/\s+/g, ' ').trim()
+}
+
+function examFromUpper(t: string): string {
+  const mod = matchClassificationRules(t, MODALITY_RULES)
+  return formatExam(t, mod, bodyPartsWithModality(t, mod))
+}
+
+// Modalities whose exam label carries the contrast phrase
+const CONTRAST_MODALITIES = new Set(['CT', 'CTA', 'MRI', 'MRA', 'MRV', 'PET', 'PET/CT'])
+
+// Short label prefixes; every other modality is used as-is
+const EXAM_PREFIXES = new Map([
+  ['Radiography', 'XR'],
+  ['Nuclear Medicine', 'NM'],
+])
+
+/**
+ * Builds the exam label from a normalized description and its classification
+ */
+function formatExam(t: string, mod: string, bodyPart: string): string {
   if (bodyPart === 'Unknown') bodyPart = 'Other'
   
-  const con = contrastPhrase(t)
-  
-  // Format based on modality type
-  if (['CT', 'CTA', 'MRI', 'MRA', 'MRV', 'PET', 'PET/CT'].includes(mod)) {
-    return `${mod} ${bodyPart}${con ? ` ${con}` : ''}`
-  }
+  const label = `${EXAM_PREFIXES.get(mod) ?? mod} ${bodyPart}`
+  if (!CONTRAST_MODALITIES.has(mod)) return label
   
-  if (mod === 'Radiography') {
-    return `XR ${bodyPart}`
-  }
+  const con = contrastPhrase(t)
+  return con ? `${label} ${con}` : label
+}
+
+export interface ExamClassification {
+  modality: string
+  examType: string
+  bodyPart: string
+}
+
+// Classifications by exact description. A user's history repeats a small set
+// of descriptions across uploads and reclassification runs, so results are
+// kept between calls; the oldest entries are dropped past the bound.
+const MAX_CLASSIFICATION_CACHE_ENTRIES = 4096
+const classificationCache = new Map<string, ExamClassification>()
+
+/**
+ * Classifies an exam description into modality, exam type, and body part in
+ * one pass. Equivalent to calling modalityFromDesc, examFromDesc and
+ * bodyPartsFromDesc separately, but the modality and body-part rules are only
+ * evaluated once (twice if whitespace normalization changes the text).
+ * Results are cached and shared between callers, so treat them as read-only.
+ */
+export function classifyExam(s: string): ExamClassification {
+  const cached = classificationCache.get(s)
+  if (cached) return cached
   
-  if (mod === 'Nuclear Medicine') {
-    return `NM ${bodyPart}`
+  const result = computeClassification(s)
+  if (classificationCache.size >= MAX_CLASSIFICATION_CACHE_ENTRIES) {
+    classificationCache.delete(classificationCache.keys().next().value as string)
   }
+  classificationCache.set(s, result)
+  return result
+}
+
+function computeClassification(s: string): ExamClassification {
+  const upper = s.toUpperCase()
+  const modality = matchClassificationRules(upper, MODALITY_RULES)
+  const bodyPart = bodyPartsWithModality(upper, modality)
   
-  if (mod === 'US' || mod === 'US - Duplex' || mod === 'US - Obstetrical' || mod === 'US Procedure') {
-    return `${mod} ${bodyPart}`
-  }
+  // Results depend only on the upper-cased text, so they carry over to the
+  // exam label unless collapsing whitespace actually changed it.
+  const t = normalizeUpper(upper)
+  const examType = t === upper ? formatExam(t, modality, bodyPart) : examFromUpper(t)
+  return { modality, examType, bodyPart }
+}
+
+// "MM/DD/YYYY HH:MM[:SS] [AM/PM]" — seconds and meridiem are optional
+const RE_US_DATETIME = /^(\d{1,2})\/(\d{1,2})\/(\d{4})\s+(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(AM|PM)?$/i
+// "YYYY-MM-DD HH:MM:SS"
+const RE_ISO_DATETIME = /^(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})$/
+
+function parseUsDateTime(dateStr: string): Date | null {
+  const amPmMatch = dateStr.match(RE_US_DATETIME)
+  if (!amPmMatch) return null
+  const [, month, day, year, hourStr, min, sec, ampm] = amPmMatch
+  let hour = parseInt(hourStr, 10)
   
-  if (mod === 'Fluoroscopy' || mod === 'Fluoroscopy - Dynamic' || mod === 'Fluoroscopy Guidance') {
-    return `${mod} ${bodyPart}`
+  if (ampm) {
+    const isPM = ampm.toUpperCase() === 'PM'
+    if (isPM && hour !== 12) hour += 12
+    if (!isPM && hour === 12) hour = 0
   }
   
-  return `${mod} ${bodyPart}`
+  return new Date(
+    parseInt(year, 10),
+    parseInt(month, 10) - 1,
+    parseInt(day, 10),
+    hour,
+    parseInt(min, 10),
+    sec ? parseInt(sec, 10) : 0
+  )
+}
+
+function parseIsoDateTime(dateStr: string): Date | null {
+  const isoMatch = dateStr.match(RE_ISO_DATETIME)
+  if (!isoMatch) return null
+  const [, year, month, day, hour, min, sec] = isoMatch
+  return new Date(
+    parseInt(year, 10),
+    parseInt(month, 10) - 1,
+    parseInt(day, 10),
+    parseInt(hour, 10),
+    parseInt(min, 10),
+    parseInt(sec, 10)
+  )
 }
 
+// Explicit formats in the order they're tried: "MM/DD/YYYY HH:MM[:SS] AM/PM"
+// first (most common from Excel), then ISO-ish "YYYY-MM-DD HH:MM:SS". The two
+// patterns never match the same string, so the order only affects speed.
+const DATE_PARSERS = [parseUsDateTime, parseIsoDateTime]
+
 /**
  * Parses date strings in various formats, including "MM/DD/YYYY HH:MM:SS AM/PM"
- * Safari and some mobile browsers are strict and don't support this format natively
+ * Safari and some mobile browsers are strict and don't support this format natively.
+ * `preferred` is the index of the explicit format to try first.
  */
-function parseDateTime(dateStr: string): Date {
+function parseDateTime(dateStr: string, preferred = 0): Date {
   if (!dateStr) return new Date(NaN)
   
-  // Handle "MM/DD/YYYY HH:MM:SS AM/PM" format first (most common from Excel)
-  const amPmMatch = dateStr.match(/^(\d{1,2})\/(\d{1,2})\/(\d{4})\s+(\d{1,2}):(\d{2}):(\d{2})\s*(AM|PM)?$/i)
-  if (amPmMatch) {
-    const [, month, day, year, hourStr, min, sec, ampm] = amPmMatch
-    let hour = parseInt(hourStr, 10)
-    
-    if (ampm) {
-      const isPM = ampm.toUpperCase() === 'PM'
-      if (isPM && hour !== 12) hour += 12
-      if (!isPM && hour === 12) hour = 0
-    }
-    
-    return new Date(
-      parseInt(year, 10),
-      parseInt(month, 10) - 1,
-      parseInt(day, 10),
-      hour,
-      parseInt(min, 10),
-      parseInt(sec, 10)
-    )
-  }
-  
-  // Handle "MM/DD/YYYY HH:MM AM/PM" format (without seconds)
-  const amPmNoSecMatch = dateStr.match(/^(\d{1,2})\/(\d{1,2})\/(\d{4})\s+(\d{1,2}):(\d{2})\s*(AM|PM)?$/i)
-  if (amPmNoSecMatch) {
-    const [, month, day, year, hourStr, min, ampm] = amPmNoSecMatch
-    let hour = parseInt(hourStr, 10)
-    
-    if (ampm) {
-      const isPM = ampm.toUpperCase() === 'PM'
-      if (isPM && hour !== 12) hour += 12
-      if (!isPM && hour === 12) hour = 0
-    }
-    
-    return new Date(
-      parseInt(year, 10),
-      parseInt(month, 10) - 1,
-      parseInt(day, 10),
-      hour,
-      parseInt(min, 10),
-      0
-    )
-  }
-  
-  // Handle ISO-ish format "YYYY-MM-DD HH:MM:SS"
-  const isoMatch = dateStr.match(/^(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})$/)
-  if (isoMatch) {
-    const [, year, month, day, hour, min, sec] = isoMatch
-    return new Date(
-      parseInt(year, 10),
-      parseInt(month, 10) - 1,
-      parseInt(day, 10),
-      parseInt(hour, 10),
-      parseInt(min, 10),
-      parseInt(sec, 10)
-    )
+  const first = DATE_PARSERS[preferred](dateStr)
+  if (first) return first
+  for (let i = 0; i < DATE_PARSERS.length; i++) {
+    if (i === preferred) continue
+    const parsed = DATE_PARSERS[i](dateStr)
+    if (parsed) return parsed
   }
   
   // Try native parsing as fallback (works in Chrome, Firefox, Node.js)
@@ -246,24 +338,40 @@ function parseDateTime(dateStr: string): Date {
   return new Date(NaN)
 }
 
+/**
+ * Index of the explicit date format that matches a sample value, so a batch
+ * whose rows share one format stops trying the others first on every row
+ */
+function sniffDateFormat(sample: string | undefined): number {
+  if (!sample) return 0
+  const index = DATE_PARSERS.findIndex(parse => parse(sample) !== null)
+  return index === -1 ? 0 : index
+}
+
 /**
  * Processes raw CSV data into structured RVU records
  */
 export function processRawData(rawData: { dictation_datetime: string; exam_description: string; wrvu_estimate: number }[]): RVURecord[] {
-  return rawData
-    .filter(row => row.dictation_datetime && row.exam_description && !isNaN(row.wrvu_estimate))
-    .map(row => {
-      const examDesc = row.exam_description
-      const parsedDate = parseDateTime(row.dictation_datetime)
-      
-      return {
-        dictationDatetime: parsedDate,
-        examDescription: examDesc,
-        wrvuEstimate: Number(row.wrvu_estimate),
-        modality: modalityFromDesc(examDesc),
-        examType: examFromDesc(examDesc),
-        bodyPart: bodyPartsFromDesc(examDesc),
-      }
+  // Validate, parse and classify each row in one pass, without building
+  // intermediate arrays between the steps
+  const records: RVURecord[] = []
+  const dateFormat = sniffDateFormat(rawData.find(row => row.dictation_datetime)?.dictation_datetime)
+  for (const row of rawData) {
+    if (!row.dictation_datetime || !row.exam_description || isNaN(row.wrvu_estimate)) continue
+    
+    const examDesc = row.exam_description
+    const parsedDate = parseDateTime(row.dictation_datetime, dateFormat)
+    const wrvuEstimate = Number(row.wrvu_estimate)
+    if (isNaN(parsedDate.getTime()) || isNaN(wrvuEstimate)) continue
+    
+    records.push({
+      dictationDatetime: parsedDate,
+      examDescription: examDesc,
+      wrvuEstimate,
+      // Uploads repeat a small set of exam descriptions; classifyExam
+      // only evaluates the rules for ones it hasn't seen
+      ...classifyExam(examDesc),
     })
-    .filter(record => !isNaN(record.dictationDatetime.getTime()) && !isNaN(record.wrvuEstimate))
+  }
+  return records
 }
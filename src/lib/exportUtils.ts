@@ -17,6 +17,15 @@ export interface ExportRow {
   wRVU: number
 }
 
+// Weekday names indexed by Date.getDay(), as toLocaleDateString('en-US',
+// { weekday: 'long' }) would spell them, without formatting a string per row
+const WEEKDAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+// Shared date/time formatters; toLocale*String with options sets up a new
+// formatter on every call
+export const EXPORT_DATE_FORMAT = new Intl.DateTimeFormat('en-US', { year: 'numeric', month: '2-digit', day: '2-digit' })
+export const EXPORT_TIME_FORMAT = new Intl.DateTimeFormat('en-US', { hour: '2-digit', minute: '2-digit', hour12: true })
+
 /**
  * Maps processed RVU records into flat, human-readable export rows.
  * Sorted chronologically to match the in-app ordering.
@@ -27,9 +36,9 @@ export function recordsToExportRows(records: RVURecord[]): ExportRow[] {
     .map(r => {
       const d = r.dictationDatetime
       return {
-        Date: d.toLocaleDateString('en-US', { year: 'numeric', month: '2-digit', day: '2-digit' }),
-        Time: d.toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit', hour12: true }),
-        'Day of Week': d.toLocaleDateString('en-US', { weekday: 'long' }),
+        Date: EXPORT_DATE_FORMAT.format(d),
+        Time: EXPORT_TIME_FORMAT.format(d),
+        'Day of Week': WEEKDAY_NAMES[d.getDay()],
         'Exam Description': r.examDescription,
         Modality: r.modality || '',
         'Body Part': r.bodyPart || '',
@@ -143,6 +143,9 @@ export default function BreakdownPage() {
     const otherModality: StudyRecord[] = []
     const lowRvu: StudyRecord[] = []
     const highRvu: StudyRecord[] = []
+    // Records with any modality/body-part issue, counted as they are sorted
+    // into the lists above rather than deduplicated from them afterwards
+    let totalIssues = 0
 
     activeRecords.forEach(record => {
       const modality = record.modality || 'Unknown'
@@ -152,6 +155,7 @@ export default function BreakdownPage() {
       if (modality === 'Unknown' || !record.modality) unknownModality.push(record)
       else if (modality === 'Other') otherModality.push(record)
       if (bodyPart === 'Unknown' || !record.bodyPart) unknownBodyPart.push(record)
+      if (modality === 'Unknown' || modality === 'Other' || bodyPart === 'Unknown') totalIssues++
       if (record.wrvuEstimate === 0) lowRvu.push(record)
       if (record.wrvuEstimate > 10) highRvu.push(record)
 
@@ -188,7 +192,7 @@ export default function BreakdownPage() {
       otherModality,
       lowRvu,
       highRvu,
-      totalIssues: new Set([...unknownModality, ...otherModality, ...unknownBodyPart]).size
+      totalIssues
     }
 
     return {
@@ -200,68 +204,69 @@ export default function BreakdownPage() {
     }
   }, [activeRecords])
 
-  // Apply filters to get displayed data
+  // Apply filters to get displayed data. Each modality goes through all the
+  // filters in one step, and the search plus any body-part selection is one
+  // pass over its studies, rather than rebuilding the whole structure per filter.
   const filteredData = useMemo(() => {
-    let result = { ...byModality }
+    const term = searchTerm.toLowerCase()
+    const result: Record<string, ModalityData> = {}
 
-    // Filter by selected modalities
-    if (selectedModalities.size > 0) {
-      result = Object.fromEntries(
-        Object.entries(result).filter(([mod]) => selectedModalities.has(mod))
-      )
-    }
+    for (const [mod, data] of Object.entries(byModality)) {
+      // Filter by selected modalities
+      if (selectedModalities.size > 0 && !selectedModalities.has(mod)) continue
+
+      if (!searchTerm) {
+        if (selectedBodyParts.size === 0) {
+          result[mod] = data
+          continue
+        }
 
-    // Filter by selected body parts (within modalities)
-    if (selectedBodyParts.size > 0) {
-      const filtered: Record<string, ModalityData> = {}
-      for (const [mod, data] of Object.entries(result)) {
+        // Filter by selected body parts (within modalities)
         const filteredBodyParts = Object.fromEntries(
           Object.entries(data.byBodyPart).filter(([bp]) => selectedBodyParts.has(bp))
         )
-        if (Object.keys(filteredBodyParts).length > 0) {
-          const filteredStudies = data.studies.filter(s => selectedBodyParts.has(s.bodyPart))
-          filtered[mod] = {
-            ...data,
-            byBodyPart: filteredBodyParts,
-            count: filteredStudies.length,
-            totalRvu: filteredStudies.reduce((sum, s) => sum + s.wrvuEstimate, 0),
-            studies: filteredStudies
-          }
+        if (Object.keys(filteredBodyParts).length === 0) continue
+        const filteredStudies = data.studies.filter(s => selectedBodyParts.has(s.bodyPart))
+        result[mod] = {
+          ...data,
+          byBodyPart: filteredBodyParts,
+          count: filteredStudies.length,
+          totalRvu: filteredStudies.reduce((sum, s) => sum + s.wrvuEstimate, 0),
+          studies: filteredStudies
         }
+        continue
       }
-      result = filtered
-    }
 
-    // Filter by search term
-    if (searchTerm) {
-      const term = searchTerm.toLowerCase()
-      const filtered: Record<string, ModalityData> = {}
-      for (const [mod, data] of Object.entries(result)) {
-        const matchingStudies = data.studies.filter(s =>
+      // Filter by search term (and selected body parts), rebuilding the body
+      // part structure from matching studies as they're found
+      const matchingStudies: StudyRecord[] = []
+      const newByBodyPart: Record<string, BodyPartData> = {}
+      let totalRvu = 0
+      for (const s of data.studies) {
+        if (selectedBodyParts.size > 0 && !selectedBodyParts.has(s.bodyPart)) continue
+        if (!(
           s.examDescription.toLowerCase().includes(term) ||
           s.modality.toLowerCase().includes(term) ||
           s.bodyPart.toLowerCase().includes(term)
-        )
-        if (matchingStudies.length > 0) {
-          // Rebuild body part structure from matching studies
-          const newByBodyPart: Record<string, BodyPartData> = {}
-          matchingStudies.forEach(s => {
-            if (!newByBodyPart[s.bodyPart]) {
-              newByBodyPart[s.bodyPart] = { count: 0, totalRvu: 0, studies: [] }
-            }
-            newByBodyPart[s.bodyPart].count++
-            newByBodyPart[s.bodyPart].totalRvu += s.wrvuEstimate
-            newByBodyPart[s.bodyPart].studies.push(s)
-          })
-          filtered[mod] = {
-            count: matchingStudies.length,
-            totalRvu: matchingStudies.reduce((sum, s) => sum + s.wrvuEstimate, 0),
-            byBodyPart: newByBodyPart,
-            studies: matchingStudies
-          }
+        )) continue
+
+        matchingStudies.push(s)
+        totalRvu += s.wrvuEstimate
+        if (!newByBodyPart[s.bodyPart]) {
+          newByBodyPart[s.bodyPart] = { count: 0, totalRvu: 0, studies: [] }
+        }
+        newByBodyPart[s.bodyPart].count++
+        newByBodyPart[s.bodyPart].totalRvu += s.wrvuEstimate
+        newByBodyPart[s.bodyPart].studies.push(s)
+      }
+      if (matchingStudies.length > 0) {
+        result[mod] = {
+          count: matchingStudies.length,
+          totalRvu,
+          byBodyPart: newByBodyPart,
+          studies: matchingStudies
         }
       }
-      result = filtered
     }
 
     return result
@@ -15,9 +15,12 @@ interface StudyRecord {
   examType: string
 }
 
-interface MatrixCell {
+interface MatrixTotal {
   count: number
   totalRvu: number
+}
+
+interface MatrixCell extends MatrixTotal {
   studies: StudyRecord[]
 }
 
@@ -51,10 +54,16 @@ export default function MatrixPage() {
     const modalitySet = new Set<string>()
     const bodyPartSet = new Set<string>()
     const modalityTotals: Record<string, MatrixCell> = {}
-    const bodyPartTotals: Record<string, MatrixCell> = {}
-    let grandTotal: MatrixCell = { count: 0, totalRvu: 0, studies: [] }
+    // Column and grand totals are only displayed as figures, so they carry
+    // no study lists
+    const bodyPartTotals: Record<string, MatrixTotal> = {}
+    const grandTotal: MatrixTotal = { count: 0, totalRvu: 0 }
+
+    // Group newest-first so every study list is already in display order and
+    // expanded rows don't re-sort on each render
+    const newestFirst = [...activeRecords].sort((a, b) => b.dictationDatetime.getTime() - a.dictationDatetime.getTime())
 
-    activeRecords.forEach(record => {
+    newestFirst.forEach(record => {
       const modality = record.modality || 'Unknown'
       const bodyPart = record.bodyPart || 'Unknown'
 
@@ -70,7 +79,7 @@ export default function MatrixPage() {
         modalityTotals[modality] = { count: 0, totalRvu: 0, studies: [] }
       }
       if (!bodyPartTotals[bodyPart]) {
-        bodyPartTotals[bodyPart] = { count: 0, totalRvu: 0, studies: [] }
+        bodyPartTotals[bodyPart] = { count: 0, totalRvu: 0 }
       }
 
       // Add to cell
@@ -86,12 +95,10 @@ export default function MatrixPage() {
       // Add to column total
       bodyPartTotals[bodyPart].count++
       bodyPartTotals[bodyPart].totalRvu += record.wrvuEstimate
-      bodyPartTotals[bodyPart].studies.push(record)
 
       // Add to grand total
       grandTotal.count++
       grandTotal.totalRvu += record.wrvuEstimate
-      grandTotal.studies.push(record)
     })
 
     const modalities = Array.from(modalitySet).sort()
@@ -299,7 +306,6 @@ export default function MatrixPage() {
                               </div>
                               <div className="grid gap-2 max-h-[400px] overflow-y-auto pr-2">
                                 {rowTotal?.studies
-                                  .sort((a, b) => b.dictationDatetime.getTime() - a.dictationDatetime.getTime())
                                   .slice(0, 100)
                                   .map((study, i) => (
                                     <div 
@@ -350,7 +356,6 @@ export default function MatrixPage() {
                                 </div>
                                 <div className="grid gap-2 max-h-[300px] overflow-y-auto pr-2">
                                   {cell.studies
-                                    .sort((a, b) => b.dictationDatetime.getTime() - a.dictationDatetime.getTime())
                                     .map((study, i) => (
                                       <div 
                                         key={i}
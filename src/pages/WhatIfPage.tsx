@@ -221,12 +221,26 @@ export default function WhatIfPage() {
 
     if (!best && records.length) {
       // Infer the current rotation from the last ~3 weeks of studies.
-      const maxT = Math.max(...records.map(r => r.dictationDatetime.getTime()))
+      const maxT = records.reduce((m, r) => Math.max(m, r.dictationDatetime.getTime()), -Infinity)
       const recent = records.filter(r => r.dictationDatetime.getTime() >= maxT - 21 * 24 * 3600 * 1000)
       const pool = recent.length ? recent : records
+      // Rotations match on modality + body part only, so tally the pool by
+      // that pair in one pass and test each rotation once per distinct pair
+      const pairs = new Map<string, StudyType>()
+      for (const r of pool) {
+        const modality = r.modality || 'Unknown'
+        const bodyPart = r.bodyPart || 'Unknown'
+        const key = `${modality} · ${bodyPart}`
+        const pair = pairs.get(key)
+        if (pair) pair.count++
+        else pairs.set(key, { modality, bodyPart, avgRvu: 0, count: 1, key: '' })
+      }
       let bestCount = 0
       for (const rot of ROTATIONS) {
-        const c = pool.filter(r => rot.match({ modality: r.modality || 'Unknown', bodyPart: r.bodyPart || 'Unknown', avgRvu: 0, count: 0, key: '' })).length
+        let c = 0
+        for (const pair of pairs.values()) {
+          if (rot.match(pair)) c += pair.count
+        }
         if (c > bestCount) { bestCount = c; best = rot.id }
       }
     }
@@ -1,8 +1,9 @@
 
 import { create } from 'zustand'
 import { supabase } from '@/lib/supabase'
-import { processRawData, modalityFromDesc, examFromDesc, bodyPartsFromDesc, RVURecord, ProcessedMetrics, DailyData, HourlyData, CaseMixData } from '@/lib/dataProcessing'
+import { processRawData, classifyExam, RVURecord, ProcessedMetrics, DailyData, HourlyData, CaseMixData } from '@/lib/dataProcessing'
 import { DEV_MODE, generateMockRecords } from '@/lib/mockData'
+import { EXPORT_DATE_FORMAT, EXPORT_TIME_FORMAT } from '@/lib/exportUtils'
 
 // Supabase returns max 1000 rows per query by default.
 // This helper paginates through all rows to fetch the complete dataset.
@@ -97,10 +98,9 @@ interface DataState {
   processData: () => void
 }
 
-// Helper function to calculate percentile
-function percentile(arr: number[], p: number): number {
-  if (arr.length === 0) return 0
-  const sorted = [...arr].sort((a, b) => a - b)
+// Helper function to calculate percentile of an ascending-sorted array
+function percentile(sorted: ArrayLike<number>, p: number): number {
+  if (sorted.length === 0) return 0
   const index = (p / 100) * (sorted.length - 1)
   const lower = Math.floor(index)
   const upper = Math.ceil(index)
@@ -108,6 +108,19 @@ function percentile(arr: number[], p: number): number {
   return sorted[lower] + (sorted[upper] - sorted[lower]) * (index - lower)
 }
 
+// Fetched rows repeat a small set of descriptions and labels, but each JSON
+// row carries its own string copies. Sharing one instance per distinct value
+// keeps memory flat for large histories.
+function createInterner(): (s: string) => string {
+  const pool = new Map<string, string>()
+  return (s: string) => {
+    const existing = pool.get(s)
+    if (existing !== undefined) return existing
+    pool.set(s, s)
+    return s
+  }
+}
+
 const defaultFilters: DateTimeFilters = {
   startDate: null,
   endDate: null,
@@ -117,6 +130,453 @@ const defaultFilters: DateTimeFilters = {
   bodyParts: [],
 }
 
+// Records the filter dropdown options were last derived from
+let optionsSourceRecords: RVURecord[] | null = null
+
+// Filtered views of the current records keyed by filter selection. Goal
+// changes and toggling a filter back reuse the earlier result; the cache is
+// dropped whenever the records array itself is replaced.
+const MAX_FILTER_CACHE_ENTRIES = 32
+let filterCacheRecords: RVURecord[] | null = null
+let filterCacheSorted = false
+const filterCache = new Map<string, RVURecord[]>()
+
+function getFilteredRecords(records: RVURecord[], filters: DateTimeFilters): RVURecord[] {
+  if (records !== filterCacheRecords) {
+    filterCache.clear()
+    filterCacheRecords = records
+    filterCacheSorted = isSortedByTime(records)
+  }
+  const key = JSON.stringify(filters)
+  const cached = filterCache.get(key)
+  if (cached) {
+    // Refresh recency so the oldest selection is evicted first
+    filterCache.delete(key)
+    filterCache.set(key, cached)
+    return cached
+  }
+
+  const result = applyFilters(records, filters, filterCacheSorted)
+  if (filterCache.size >= MAX_FILTER_CACHE_ENTRIES) {
+    filterCache.delete(filterCache.keys().next().value as string)
+  }
+  filterCache.set(key, result)
+  return result
+}
+
+function isSortedByTime(records: RVURecord[]): boolean {
+  for (let i = 1; i < records.length; i++) {
+    if (records[i].dictationDatetime.getTime() < records[i - 1].dictationDatetime.getTime()) return false
+  }
+  return true
+}
+
+// Index of the first record whose time is >= t (or > t when `after` is set)
+function lowerBound(records: RVURecord[], t: number, after: boolean): number {
+  let lo = 0
+  let hi = records.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    const time = records[mid].dictationDatetime.getTime()
+    if (time < t || (after && time === t)) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+function applyFilters(records: RVURecord[], filters: DateTimeFilters, sortedByTime: boolean): RVURecord[] {
+  // Apply all filters in a single pass; date bounds are resolved once and
+  // the modality/body-part selections become Sets for O(1) membership
+  let startTime = -Infinity
+  if (filters.startDate) {
+    const startDate = new Date(filters.startDate)
+    startDate.setHours(0, 0, 0, 0)
+    startTime = startDate.getTime()
+  }
+  let endTime = Infinity
+  if (filters.endDate) {
+    const endDate = new Date(filters.endDate)
+    endDate.setHours(23, 59, 59, 999)
+    endTime = endDate.getTime()
+  }
+  const { startHour, endHour } = filters
+  const modalitySet = filters.modalities.length > 0 ? new Set(filters.modalities) : null
+  const bodyPartSet = filters.bodyParts.length > 0 ? new Set(filters.bodyParts) : null
+  const hasFilters = startTime !== -Infinity || endTime !== Infinity ||
+    startHour !== null || endHour !== null || modalitySet !== null || bodyPartSet !== null
+
+  // Nothing to filter: share the records array rather than copying it
+  if (!hasFilters) return records
+
+  // Records arrive ordered by dictation time, so the date range is a
+  // contiguous slice found by binary search instead of a per-record check
+  let candidates = records
+  if (sortedByTime && (startTime !== -Infinity || endTime !== Infinity)) {
+    const lo = startTime === -Infinity ? 0 : lowerBound(records, startTime, false)
+    const hi = endTime === Infinity ? records.length : lowerBound(records, endTime, true)
+    candidates = records.slice(lo, Math.max(lo, hi))
+    if (startHour === null && endHour === null && !modalitySet && !bodyPartSet) return candidates
+  }
+
+  return candidates.filter(r => {
+    const t = r.dictationDatetime.getTime()
+    if (t < startTime || t > endTime) return false
+    if (startHour !== null || endHour !== null) {
+      const hour = r.dictationDatetime.getHours()
+      if (startHour !== null && hour < startHour) return false
+      if (endHour !== null && hour > endHour) return false
+    }
+    if (modalitySet && !modalitySet.has(r.modality)) return false
+    if (bodyPartSet && !bodyPartSet.has(r.bodyPart)) return false
+    return true
+  })
+}
+
+// Weekday names indexed by Date.getDay(), in heatmap row order
+const DOW_ORDER = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+type DailyTotal = Omit<DailyData, 'meetsTarget'>
+
+// Everything processData derives from a set of records that doesn't depend on
+// the daily goal; the goal only decides which days and hours meet target.
+interface RecordAggregates {
+  summary: Omit<ProcessedMetrics, 'targetHitRate'>
+  daily: DailyTotal[]
+  hourlyRvu: number[]
+  caseMixData: CaseMixData[]
+  modalityData: { name: string; value: number }[]
+  heatmapData: { dow: string; hour: number; rvu: number }[]
+}
+
+// Aggregates per filtered record set. Filtered views are themselves cached,
+// so goal changes and repeated filter selections skip the aggregation passes.
+const aggregateCache = new WeakMap<RVURecord[], RecordAggregates>()
+
+function getAggregates(activeRecords: RVURecord[]): RecordAggregates {
+  let aggregates = aggregateCache.get(activeRecords)
+  if (!aggregates) {
+    aggregates = aggregateRecords(activeRecords)
+    aggregateCache.set(activeRecords, aggregates)
+  }
+  return aggregates
+}
+
+// Goal-flagged daily/hourly series for a set of aggregates. Returning a filter
+// selection to an earlier one at the same goal reuses the same arrays, so the
+// charts' memoized rows are reused too.
+interface GoalViews {
+  goal: number
+  dailyData: DailyData[]
+  hourlyData: HourlyData[]
+  targetHitRate: number
+}
+
+const goalViewCache = new WeakMap<RecordAggregates, GoalViews>()
+
+function getGoalViews(aggregates: RecordAggregates, goal: number): GoalViews {
+  const cached = goalViewCache.get(aggregates)
+  if (cached && cached.goal === goal) return cached
+
+  // Target hit rate is counted while flagging days, without filtering out a
+  // second array just to take its length
+  let daysMeetingTarget = 0
+  const dailyData: DailyData[] = aggregates.daily.map(d => {
+    const meetsTarget = d.rvu >= goal
+    if (meetsTarget) daysMeetingTarget++
+    return { ...d, meetsTarget }
+  })
+  const targetHitRate = (daysMeetingTarget / dailyData.length) * 100
+
+  const hourlyData: HourlyData[] = aggregates.hourlyRvu.map((rvu, hour) => ({
+    hour,
+    rvu,
+    meetsTarget: rvu >= goal / 8,
+  }))
+
+  const views = { goal, dailyData, hourlyData, targetHitRate }
+  goalViewCache.set(aggregates, views)
+  return views
+}
+
+function aggregateRecords(activeRecords: RVURecord[]): RecordAggregates {
+  // One pass over the records feeds every per-record aggregate: totals, date
+  // bounds, daily/hourly/weekday/heatmap bins, case mix and modality sums.
+  // Weekdays are kept in first-seen order so peak-day ties resolve as before.
+  let totalRvu = 0
+  let minTime = Infinity
+  let maxTime = -Infinity
+  // Per-day totals plus a timestamp from that day, to order days numerically
+  const dailyMap = new Map<string, { rvu: number; time: number }>()
+  let daysInOrder = true
+  let lastNewDayTime = -Infinity
+  // The current record's calendar day as a [start, end) time range. Records
+  // mostly arrive grouped by day, so the day key, weekday and daily entry are
+  // derived once per day instead of formatting a date string per record.
+  let dayStart = 0
+  let dayEnd = 0
+  let dow = 0
+  let day = { rvu: 0, time: 0 }
+  const hourlyTotals = new Float64Array(24)
+  const heatmapBins = new Float64Array(7 * 24)
+  const dowTotals = new Float64Array(7)
+  const dowsSeen: number[] = []
+  let seenMask = 0
+  const caseMixMap = new Map<string, { rvu: number; cases: number }>()
+  const modalityMap = new Map<string, number>()
+
+  for (const r of activeRecords) {
+    const dt = r.dictationDatetime
+    const rvu = r.wrvuEstimate
+    const t = dt.getTime()
+    const hour = dt.getHours()
+
+    totalRvu += rvu
+    if (t < minTime) minTime = t
+    if (t > maxTime) maxTime = t
+
+    if (!(t >= dayStart && t < dayEnd)) {
+      const y = dt.getFullYear()
+      const m = dt.getMonth()
+      const d = dt.getDate()
+      dayStart = new Date(y, m, d).getTime()
+      dayEnd = new Date(y, m, d + 1).getTime()
+      dow = dt.getDay()
+      const dateStr = dt.toDateString()
+      const existing = dailyMap.get(dateStr)
+      if (existing) {
+        day = existing
+      } else {
+        day = { rvu: 0, time: t }
+        dailyMap.set(dateStr, day)
+        if (t < lastNewDayTime) daysInOrder = false
+        lastNewDayTime = t
+      }
+    }
+    day.rvu += rvu
+    hourlyTotals[hour] += rvu
+    heatmapBins[dow * 24 + hour] += rvu
+    dowTotals[dow] += rvu
+    if (!(seenMask & (1 << dow))) {
+      seenMask |= 1 << dow
+      dowsSeen.push(dow)
+    }
+
+    const key = `${r.modality} - ${r.bodyPart}`
+    const mix = caseMixMap.get(key)
+    if (mix) {
+      mix.rvu += rvu
+      mix.cases++
+    } else {
+      caseMixMap.set(key, { rvu, cases: 1 })
+    }
+    modalityMap.set(r.modality, (modalityMap.get(r.modality) || 0) + rvu)
+  }
+
+  // Calculate metrics
+  const cases = activeRecords.length
+  const rvuPerCase = totalRvu / cases
+
+  const daysWorked = dailyMap.size
+  const avgCasesDay = cases / daysWorked
+  const avgRvuDay = totalRvu / daysWorked
+
+  const dateRange = Math.ceil((maxTime - minTime) / (1000 * 60 * 60 * 24)) + 1
+  const workEfficiency = (daysWorked / dateRange) * 100
+
+  const rvuPerHour = avgRvuDay / 8
+
+  // Daily data. Records normally arrive in time order, in which case days were
+  // first seen chronologically and need no sort; otherwise order by the
+  // stored timestamp rather than re-parsing the date strings per comparison.
+  const dayEntries = Array.from(dailyMap.entries())
+  if (!daysInOrder) dayEntries.sort((a, b) => a[1].time - b[1].time)
+
+  // Daily totals as one contiguous numeric array; the moving average, slope
+  // and best-day scans below all read from it
+  const n = dayEntries.length
+  const dailyRvu = new Float64Array(n)
+  for (let i = 0; i < n; i++) dailyRvu[i] = dayEntries[i][1].rvu
+
+  // 7-day moving average over worked days, kept as a running window sum
+  // instead of re-slicing and re-summing the window for every day
+  let windowSum = 0
+  const daily: DailyTotal[] = dayEntries.map(([date], i) => {
+    const rvu = dailyRvu[i]
+    windowSum += rvu
+    if (i >= 7) windowSum -= dailyRvu[i - 7]
+    const ma7 = windowSum / Math.min(i + 1, 7)
+    return { date, rvu, ma7 }
+  })
+
+  // Calculate trend slope (least squares over day index 0..n-1). With evenly
+  // spaced x the deviations sum to zero, so the numerator needs no y mean and
+  // Σ(x - x̄)² has the closed form n(n² - 1) / 12.
+  // The same walk over the daily series finds the best day's position.
+  const xMean = (n - 1) / 2
+  let numerator = 0
+  let bestIdx = 0
+  for (let i = 0; i < n; i++) {
+    const rvu = dailyRvu[i]
+    numerator += (i - xMean) * rvu
+    if (rvu > dailyRvu[bestIdx]) bestIdx = i
+  }
+  const denominator = (n * (n * n - 1)) / 12
+  const trendSlope = denominator !== 0 ? numerator / denominator : 0
+
+  // Best day (first day with the highest total)
+  const bestDay = daily[bestIdx]
+
+  // Hourly data
+  const hourlyRvu = Array.from(hourlyTotals, totalRvuHour => totalRvuHour / daysWorked)
+
+  const peakHour = hourlyRvu.reduce((peak, rvu, hour) => rvu > hourlyRvu[peak] ? hour : peak, 0)
+
+  // Case mix data
+  // RVU sum and case count come from the same accumulator; only the top five
+  // entries are turned into output rows
+  const caseMixData: CaseMixData[] = Array.from(caseMixMap.entries())
+    .sort((a, b) => b[1].rvu - a[1].rvu)
+    .slice(0, 5)
+    .map(([label, { rvu, cases }]) => ({ label, rvu, cases, modality: label.split(' - ')[0] }))
+
+  // Modality data
+  const modalityData = Array.from(modalityMap.entries())
+    .map(([name, value]) => ({ name, value }))
+    .sort((a, b) => b.value - a.value)
+
+  // Heatmap data, binned by numeric weekday/hour (dow * 24 + hour)
+  const heatmapData: { dow: string; hour: number; rvu: number }[] = []
+  DOW_ORDER.forEach((dow, d) => {
+    for (let hour = 0; hour < 24; hour++) {
+      heatmapData.push({
+        dow,
+        hour,
+        rvu: heatmapBins[d * 24 + hour],
+      })
+    }
+  })
+
+  let peakDowIdx = -1
+  for (const d of dowsSeen) {
+    if (peakDowIdx === -1 || dowTotals[d] > dowTotals[peakDowIdx]) peakDowIdx = d
+  }
+  const peakDowName = peakDowIdx === -1 ? '' : DOW_ORDER[peakDowIdx]
+
+  return {
+    summary: {
+      totalRvu,
+      cases,
+      rvuPerCase,
+      daysWorked,
+      avgCasesDay,
+      avgRvuDay,
+      workEfficiency,
+      rvuPerHour,
+      trendSlope,
+      bestDayDate: bestDay?.date || '',
+      bestDayRvu: bestDay?.rvu || 0,
+      ma7: daily[daily.length - 1]?.ma7 || 0,
+      peakHour,
+      peakDow: peakDowName,
+      annualProjection: avgRvuDay * 250,
+    },
+    daily,
+    hourlyRvu,
+    caseMixData,
+    modalityData,
+    heatmapData,
+  }
+}
+
+// Goal suggestions from the percentiles of the daily totals; needs at least
+// five days of data
+function suggestGoals(dailyData: DailyData[], metrics: ProcessedMetrics | null): SuggestedGoals | null {
+  if (!dailyData || dailyData.length < 5 || !metrics) {
+    return null
+  }
+
+  // Get daily RVU values, copied and sorted once for every percentile below
+  const dailyRvus = Float64Array.from(dailyData, d => d.rvu).sort()
+  
+  // Calculate percentiles
+  const p50 = percentile(dailyRvus, 50)  // Median
+  const p65 = percentile(dailyRvus, 65)  // Moderate stretch
+  const p80 = percentile(dailyRvus, 80)  // Aggressive
+  const p90 = percentile(dailyRvus, 90)  // Stretch goal
+  
+  // Determine recommendation based on current performance
+  let description = ''
+  const avg = metrics.avgRvuDay
+  
+  if (avg < p50) {
+    description = `Your average (${avg.toFixed(1)}) is below your median day. The "Moderate" goal would help you reach more consistent performance.`
+  } else if (avg < p65) {
+    description = `You're performing well! The "Moderate" goal (${p65.toFixed(1)}) represents your better days and is achievable with focus.`
+  } else if (avg < p80) {
+    description = `Strong performance! Consider the "Aggressive" goal (${p80.toFixed(1)}) to push your top-end productivity.`
+  } else {
+    description = `Excellent! You're already performing at a high level. The "Stretch" goal (${p90.toFixed(1)}) would challenge your best days.`
+  }
+
+  const suggestedGoals: SuggestedGoals = {
+    conservative: Math.round(p50 * 2) / 2,  // Round to nearest 0.5
+    moderate: Math.round(p65 * 2) / 2,
+    aggressive: Math.round(p80 * 2) / 2,
+    stretch: Math.round(p90 * 2) / 2,
+    currentAverage: Math.round(avg * 2) / 2,
+    description,
+  }
+  return suggestedGoals
+}
+
+// Everything processData publishes for the given records, goal and filters.
+// Building it as one object lets each action apply it in a single store
+// update, so subscribers re-render once per change rather than once per field.
+function deriveProcessedState(
+  { records, goalRvuPerDay, filters }: Pick<DataState, 'records' | 'goalRvuPerDay' | 'filters'>
+): Partial<DataState> {
+  if (records.length === 0) {
+    return { metrics: null, dailyData: [], hourlyData: [], caseMixData: [], modalityData: [], heatmapData: [], filteredRecords: [] }
+  }
+
+  const changes: Partial<DataState> = {}
+
+  // Compute available modalities and body parts from all records (for filter
+  // dropdowns). These only change with the records, not with filters or goal.
+  if (records !== optionsSourceRecords) {
+    optionsSourceRecords = records
+    const modalitySet = new Set<string>()
+    const bodyPartSet = new Set<string>()
+    for (const r of records) {
+      if (r.modality) modalitySet.add(r.modality)
+      if (r.bodyPart) bodyPartSet.add(r.bodyPart)
+    }
+    changes.availableModalities = [...modalitySet].sort()
+    changes.availableBodyParts = [...bodyPartSet].sort()
+  }
+
+  const filteredRecords = getFilteredRecords(records, filters)
+  changes.filteredRecords = filteredRecords
+
+  if (filteredRecords.length === 0) {
+    return { ...changes, metrics: null, dailyData: [], hourlyData: [], caseMixData: [], modalityData: [], heatmapData: [] }
+  }
+
+  const aggregates = getAggregates(filteredRecords)
+  const { summary, caseMixData, modalityData, heatmapData } = aggregates
+  const { dailyData, hourlyData, targetHitRate } = getGoalViews(aggregates, goalRvuPerDay)
+
+  const metrics: ProcessedMetrics = { ...summary, targetHitRate }
+  Object.assign(changes, { metrics, dailyData, hourlyData, caseMixData, modalityData, heatmapData })
+
+  // Suggested goals follow the processed data; keep the previous suggestion
+  // when there isn't enough data for a new one
+  const suggestedGoals = suggestGoals(dailyData, metrics)
+  if (suggestedGoals) changes.suggestedGoals = suggestedGoals
+
+  return changes
+}
+
 export const useDataStore = create<DataState>((set, get) => ({
   records: [],
   filteredRecords: [],
@@ -135,19 +595,16 @@ export const useDataStore = create<DataState>((set, get) => ({
   falseDuplicates: [],
 
   setGoalRvuPerDay: (goal: number) => {
-    set({ goalRvuPerDay: goal })
-    get().processData()
+    set({ goalRvuPerDay: goal, ...deriveProcessedState({ ...get(), goalRvuPerDay: goal }) })
   },
 
   setFilters: (newFilters: Partial<DateTimeFilters>) => {
-    const currentFilters = get().filters
-    set({ filters: { ...currentFilters, ...newFilters } })
-    get().processData()
+    const filters = { ...get().filters, ...newFilters }
+    set({ filters, ...deriveProcessedState({ ...get(), filters }) })
   },
 
   clearFilters: () => {
-    set({ filters: defaultFilters })
-    get().processData()
+    set({ filters: defaultFilters, ...deriveProcessedState({ ...get(), filters: defaultFilters }) })
   },
 
   setFalseDuplicates: (duplicates: FalseDuplicate[]) => {
@@ -218,44 +675,8 @@ export const useDataStore = create<DataState>((set, get) => ({
 
   calculateSuggestedGoals: () => {
     const { dailyData, metrics } = get()
-    
-    if (!dailyData || dailyData.length < 5 || !metrics) {
-      return null
-    }
-
-    // Get daily RVU values
-    const dailyRvus = dailyData.map(d => d.rvu)
-    
-    // Calculate percentiles
-    const p50 = percentile(dailyRvus, 50)  // Median
-    const p65 = percentile(dailyRvus, 65)  // Moderate stretch
-    const p80 = percentile(dailyRvus, 80)  // Aggressive
-    const p90 = percentile(dailyRvus, 90)  // Stretch goal
-    
-    // Determine recommendation based on current performance
-    let description = ''
-    const avg = metrics.avgRvuDay
-    
-    if (avg < p50) {
-      description = `Your average (${avg.toFixed(1)}) is below your median day. The "Moderate" goal would help you reach more consistent performance.`
-    } else if (avg < p65) {
-      description = `You're performing well! The "Moderate" goal (${p65.toFixed(1)}) represents your better days and is achievable with focus.`
-    } else if (avg < p80) {
-      description = `Strong performance! Consider the "Aggressive" goal (${p80.toFixed(1)}) to push your top-end productivity.`
-    } else {
-      description = `Excellent! You're already performing at a high level. The "Stretch" goal (${p90.toFixed(1)}) would challenge your best days.`
-    }
-
-    const suggestedGoals: SuggestedGoals = {
-      conservative: Math.round(p50 * 2) / 2,  // Round to nearest 0.5
-      moderate: Math.round(p65 * 2) / 2,
-      aggressive: Math.round(p80 * 2) / 2,
-      stretch: Math.round(p90 * 2) / 2,
-      currentAverage: Math.round(avg * 2) / 2,
-      description,
-    }
-
-    set({ suggestedGoals })
+    const suggestedGoals = suggestGoals(dailyData, metrics)
+    if (suggestedGoals) set({ suggestedGoals })
     return suggestedGoals
   },
 
@@ -265,14 +686,15 @@ export const useDataStore = create<DataState>((set, get) => ({
       // Dev mode: use generated mock data
       if (DEV_MODE) {
         const mockData = generateMockRecords()
+        const intern = createInterner()
         const records: RVURecord[] = mockData.map(r => ({
           id: r.id,
           dictationDatetime: new Date(r.dictation_datetime),
-          examDescription: r.exam_description,
+          examDescription: intern(r.exam_description),
           wrvuEstimate: Number(r.wrvu_estimate),
-          modality: r.modality || '',
-          examType: r.exam_type || '',
-          bodyPart: r.body_part || '',
+          modality: intern(r.modality || ''),
+          examType: intern(r.exam_type || ''),
+          bodyPart: intern(r.body_part || ''),
         }))
         set({ records })
         get().processData()
@@ -282,20 +704,23 @@ export const useDataStore = create<DataState>((set, get) => ({
       const { data, error } = await fetchAllRows(
         supabase
           .from('rvu_records')
-          .select('*')
+          // Only the columns a record is built from; skips user_id and any
+          // bookkeeping columns in every row of the response
+          .select('id, dictation_datetime, exam_description, wrvu_estimate, modality, exam_type, body_part')
           .eq('user_id', userId)
           .order('dictation_datetime', { ascending: true })
       )
 
       if (!error && data) {
+        const intern = createInterner()
         const records: RVURecord[] = data.map(r => ({
           id: r.id,
           dictationDatetime: new Date(r.dictation_datetime),
-          examDescription: r.exam_description,
+          examDescription: intern(r.exam_description),
           wrvuEstimate: Number(r.wrvu_estimate),
-          modality: r.modality || '',
-          examType: r.exam_type || '',
-          bodyPart: r.body_part || '',
+          modality: intern(r.modality || ''),
+          examType: intern(r.exam_type || ''),
+          bodyPart: intern(r.body_part || ''),
         }))
         set({ records })
         get().processData()
@@ -496,7 +921,7 @@ export const useDataStore = create<DataState>((set, get) => ({
       const { data, error: fetchError } = await fetchAllRows(
         supabase
           .from('rvu_records')
-          .select('id, exam_description')
+          .select('exam_description')
           .eq('user_id', userId)
       )
 
@@ -504,32 +929,41 @@ export const useDataStore = create<DataState>((set, get) => ({
         return { error: fetchError as Error | null, count: 0 }
       }
 
+      // Classification depends only on the description, so group the rows by
+      // description and write each distinct one back with a single update
+      // instead of one request per row
+      const rowCounts = new Map<string, number>()
+      for (const record of data) {
+        rowCounts.set(record.exam_description, (rowCounts.get(record.exam_description) || 0) + 1)
+      }
+      const descriptions = [...rowCounts.keys()]
+
       // Process in parallel batches of 50
       const batchSize = 50
       let updatedCount = 0
 
-      for (let i = 0; i < data.length; i += batchSize) {
-        const batch = data.slice(i, i + batchSize)
+      for (let i = 0; i < descriptions.length; i += batchSize) {
+        const batch = descriptions.slice(i, i + batchSize)
         
         // Run batch updates in parallel
         const results = await Promise.all(
-          batch.map(record => {
-            const newModality = modalityFromDesc(record.exam_description)
-            const newExamType = examFromDesc(record.exam_description)
-            const newBodyPart = bodyPartsFromDesc(record.exam_description)
+          batch.map(async desc => {
+            const { modality, examType, bodyPart } = classifyExam(desc)
 
-            return supabase
+            const { error } = await supabase
               .from('rvu_records')
               .update({
-                modality: newModality,
-                exam_type: newExamType,
-                body_part: newBodyPart,
+                modality,
+                exam_type: examType,
+                body_part: bodyPart,
               })
-              .eq('id', record.id)
+              .eq('user_id', userId)
+              .eq('exam_description', desc)
+            return error ? 0 : rowCounts.get(desc)!
           })
         )
 
-        updatedCount += results.filter(r => !r.error).length
+        updatedCount += results.reduce((sum, n) => sum + n, 0)
       }
 
       // Refresh records
@@ -580,9 +1014,9 @@ export const useDataStore = create<DataState>((set, get) => ({
     // Convert records to CSV rows
     const rows = data.map(record => {
       const date = new Date(record.dictation_datetime)
-      const dayOfWeek = date.toLocaleDateString('en-US', { weekday: 'long' })
-      const dateStr = date.toLocaleDateString('en-US', { year: 'numeric', month: '2-digit', day: '2-digit' })
-      const timeStr = date.toLocaleTimeString('en-US', { hour: '2-digit', minute: '2-digit', hour12: true })
+      const dayOfWeek = DOW_ORDER[date.getDay()]
+      const dateStr = EXPORT_DATE_FORMAT.format(date)
+      const timeStr = EXPORT_TIME_FORMAT.format(date)
       
       return [
         dateStr,
@@ -604,206 +1038,7 @@ export const useDataStore = create<DataState>((set, get) => ({
   },
 
   processData: () => {
-    const { records, goalRvuPerDay, filters } = get()
-    if (records.length === 0) {
-      set({ metrics: null, dailyData: [], hourlyData: [], caseMixData: [], modalityData: [], heatmapData: [], filteredRecords: [] })
-      return
-    }
-
-    // Compute available modalities and body parts from all records (for filter dropdowns)
-    const allModalities = [...new Set(records.map(r => r.modality).filter(Boolean))].sort()
-    const allBodyParts = [...new Set(records.map(r => r.bodyPart).filter(Boolean))].sort()
-    set({ availableModalities: allModalities, availableBodyParts: allBodyParts })
-
-    // Apply filters
-    let filteredRecords = [...records]
-    
-    // Date range filter
-    if (filters.startDate) {
-      const startDate = new Date(filters.startDate)
-      startDate.setHours(0, 0, 0, 0)
-      filteredRecords = filteredRecords.filter(r => r.dictationDatetime >= startDate)
-    }
-    if (filters.endDate) {
-      const endDate = new Date(filters.endDate)
-      endDate.setHours(23, 59, 59, 999)
-      filteredRecords = filteredRecords.filter(r => r.dictationDatetime <= endDate)
-    }
-    
-    // Time range filter
-    if (filters.startHour !== null) {
-      filteredRecords = filteredRecords.filter(r => r.dictationDatetime.getHours() >= filters.startHour!)
-    }
-    if (filters.endHour !== null) {
-      filteredRecords = filteredRecords.filter(r => r.dictationDatetime.getHours() <= filters.endHour!)
-    }
-
-    // Modality filter
-    if (filters.modalities.length > 0) {
-      filteredRecords = filteredRecords.filter(r => filters.modalities.includes(r.modality))
-    }
-
-    // Body part filter
-    if (filters.bodyParts.length > 0) {
-      filteredRecords = filteredRecords.filter(r => filters.bodyParts.includes(r.bodyPart))
-    }
-
-    // Store filtered records
-    set({ filteredRecords })
-
-    if (filteredRecords.length === 0) {
-      set({ metrics: null, dailyData: [], hourlyData: [], caseMixData: [], modalityData: [], heatmapData: [] })
-      return
-    }
-
-    // Use filtered records for calculations
-    const activeRecords = filteredRecords
-
-    // Calculate metrics
-    const totalRvu = activeRecords.reduce((sum, r) => sum + r.wrvuEstimate, 0)
-    const cases = activeRecords.length
-    const rvuPerCase = totalRvu / cases
-
-    const uniqueDates = new Set(activeRecords.map(r => r.dictationDatetime.toDateString()))
-    const daysWorked = uniqueDates.size
-    const avgCasesDay = cases / daysWorked
-    const avgRvuDay = totalRvu / daysWorked
-
-    const dates = activeRecords.map(r => r.dictationDatetime)
-    const minDate = new Date(Math.min(...dates.map(d => d.getTime())))
-    const maxDate = new Date(Math.max(...dates.map(d => d.getTime())))
-    const dateRange = Math.ceil((maxDate.getTime() - minDate.getTime()) / (1000 * 60 * 60 * 24)) + 1
-    const workEfficiency = (daysWorked / dateRange) * 100
-
-    const rvuPerHour = avgRvuDay / 8
-
-    // Daily data
-    const dailyMap = new Map<string, number>()
-    activeRecords.forEach(r => {
-      const dateStr = r.dictationDatetime.toDateString()
-      dailyMap.set(dateStr, (dailyMap.get(dateStr) || 0) + r.wrvuEstimate)
-    })
-
-    const sortedDates = Array.from(dailyMap.entries())
-      .sort((a, b) => new Date(a[0]).getTime() - new Date(b[0]).getTime())
-
-    const dailyData: DailyData[] = sortedDates.map(([date, rvu], i) => {
-      const last7 = sortedDates.slice(Math.max(0, i - 6), i + 1)
-      const ma7 = last7.reduce((sum, [, r]) => sum + r, 0) / last7.length
-      return {
-        date,
-        rvu,
-        ma7,
-        meetsTarget: rvu >= goalRvuPerDay,
-      }
-    })
-
-    // Calculate trend slope
-    const xMean = (dailyData.length - 1) / 2
-    const yMean = dailyData.reduce((sum, d) => sum + d.rvu, 0) / dailyData.length
-    const numerator = dailyData.reduce((sum, d, i) => sum + (i - xMean) * (d.rvu - yMean), 0)
-    const denominator = dailyData.reduce((sum, _, i) => sum + Math.pow(i - xMean, 2), 0)
-    const trendSlope = denominator !== 0 ? numerator / denominator : 0
-
-    // Target hit rate
-    const targetHitRate = (dailyData.filter(d => d.meetsTarget).length / dailyData.length) * 100
-
-    // Best day
-    const bestDay = dailyData.reduce((best, curr) => curr.rvu > best.rvu ? curr : best, dailyData[0])
-
-    // Hourly data
-    const hourlyMap = new Map<number, number>()
-    activeRecords.forEach(r => {
-      const hour = r.dictationDatetime.getHours()
-      hourlyMap.set(hour, (hourlyMap.get(hour) || 0) + r.wrvuEstimate)
-    })
-
-    const hourlyData: HourlyData[] = Array.from({ length: 24 }, (_, hour) => {
-      const totalRvuHour = hourlyMap.get(hour) || 0
-      const rvuPerHourAvg = totalRvuHour / daysWorked
-      return {
-        hour,
-        rvu: rvuPerHourAvg,
-        meetsTarget: rvuPerHourAvg >= goalRvuPerDay / 8,
-      }
-    })
-
-    const peakHour = hourlyData.reduce((peak, curr) => curr.rvu > peak.rvu ? curr : peak, hourlyData[0]).hour
-
-    // Case mix data
-    const caseMixMap = new Map<string, { rvu: number; cases: number }>()
-    activeRecords.forEach(r => {
-      const key = `${r.modality} - ${r.bodyPart}`
-      const existing = caseMixMap.get(key) || { rvu: 0, cases: 0 }
-      caseMixMap.set(key, { rvu: existing.rvu + r.wrvuEstimate, cases: existing.cases + 1 })
-    })
-
-    const caseMixData: CaseMixData[] = Array.from(caseMixMap.entries())
-      .map(([label, { rvu, cases }]) => ({ label, rvu, cases, modality: label.split(' - ')[0] }))
-      .sort((a, b) => b.rvu - a.rvu)
-      .slice(0, 5)
-
-    // Modality data
-    const modalityMap = new Map<string, number>()
-    activeRecords.forEach(r => {
-      modalityMap.set(r.modality, (modalityMap.get(r.modality) || 0) + r.wrvuEstimate)
-    })
-
-    const modalityData = Array.from(modalityMap.entries())
-      .map(([name, value]) => ({ name, value }))
-      .sort((a, b) => b.value - a.value)
-
-    // Heatmap data
-    const dowOrder = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-    const heatmapMap = new Map<string, number>()
-    activeRecords.forEach(r => {
-      const dow = dowOrder[r.dictationDatetime.getDay()]
-      const hour = r.dictationDatetime.getHours()
-      const key = `${dow}-${hour}`
-      heatmapMap.set(key, (heatmapMap.get(key) || 0) + r.wrvuEstimate)
-    })
-
-    const heatmapData: { dow: string; hour: number; rvu: number }[] = []
-    dowOrder.forEach(dow => {
-      for (let hour = 0; hour < 24; hour++) {
-        heatmapData.push({
-          dow,
-          hour,
-          rvu: heatmapMap.get(`${dow}-${hour}`) || 0,
-        })
-      }
-    })
-
-    const peakDow = activeRecords.reduce((acc, r) => {
-      const dow = dowOrder[r.dictationDatetime.getDay()]
-      acc[dow] = (acc[dow] || 0) + r.wrvuEstimate
-      return acc
-    }, {} as Record<string, number>)
-    const peakDowName = Object.entries(peakDow).sort((a, b) => b[1] - a[1])[0]?.[0] || ''
-
-    const metrics: ProcessedMetrics = {
-      totalRvu,
-      cases,
-      rvuPerCase,
-      daysWorked,
-      avgCasesDay,
-      avgRvuDay,
-      workEfficiency,
-      rvuPerHour,
-      trendSlope,
-      targetHitRate,
-      bestDayDate: bestDay?.date || '',
-      bestDayRvu: bestDay?.rvu || 0,
-      ma7: dailyData[dailyData.length - 1]?.ma7 || 0,
-      peakHour,
-      peakDow: peakDowName,
-      annualProjection: avgRvuDay * 250,
-    }
-
-    set({ metrics, dailyData, hourlyData, caseMixData, modalityData, heatmapData })
-    
-    // Calculate suggested goals after data is processed
-    get().calculateSuggestedGoals()
+    set(deriveProcessedState(get()))
   },
 }))
 